@@ -4,8 +4,6 @@ from typing import TYPE_CHECKING
 
 import logging
 
-from carconnectivity.carconnectivity_base import CLI
-
 from carconnectivity_plugins.homekit._version import __version__
 
 if TYPE_CHECKING:
@@ -20,7 +18,10 @@ def main() -> None:
 
     This function initializes and starts the command-line interface (CLI) for the
     car connectivity application using the specified logger and application name.
+    The CLI is imported here to keep importing this module lightweight.
     """
+    from carconnectivity.carconnectivity_base import CLI  # pylint: disable=import-outside-toplevel
+
     cli: CLI = CLI(logger=LOG, name='carconnectivity-homekit', description='Commandline Interface to interact with Car Services of various brands',
                    subversion=__version__)
     cli.main()
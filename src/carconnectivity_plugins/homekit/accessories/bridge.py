@@ -2,10 +2,13 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
+import os
 import logging
-import json
+import threading
+from functools import lru_cache
+from contextlib import contextmanager
 
-from pyhap.accessory import Bridge
+from pyhap.accessory import Accessory, Bridge
 from pyhap.accessory_driver import AccessoryDriver
 
 from carconnectivity.observable import Observable
@@ -24,12 +27,42 @@ from carconnectivity_plugins.homekit._version import __version__
 
 
 if TYPE_CHECKING:
-    from typing import Optional, Any, Dict, List
+    from typing import Optional, Any, Dict, List, Tuple, Type, FrozenSet, Iterator
 
     from carconnectivity.carconnectivity import CarConnectivity
+    from carconnectivity.attributes import GenericAttribute
+    from carconnectivity.commands import Commands
+
+    from carconnectivity_plugins.homekit.accessories.generic_accessory import GenericAccessory
 
 LOG: logging.Logger = logging.getLogger("carconnectivity.plugins.homekit.bridge")
 
+_OBSERVER_ENABLED: Observable.ObserverEvent = Observable.ObserverEvent.ENABLED
+
+
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize the accessory config to JSON bytes."""
+        return orjson.dumps(obj)
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover
+    import json
+
+    def _dumps(obj: Any) -> bytes:
+        """Serialize the accessory config to JSON bytes."""
+        return json.dumps(obj).encode('utf-8')
+
+    _loads = json.loads
+
+
+@lru_cache(maxsize=256)
+def _identifier(vin: str, id_str: str) -> str:
+    """Returns the key of an accessory in the accessory config, e.g. `<vin>-Climatization`."""
+    return f'{vin}-{id_str}'
+
 
 class CarConnectivityBridge(Bridge):
     """CarConnectivity Bridge"""
@@ -43,13 +76,24 @@ class CarConnectivityBridge(Bridge):
         self.set_info_service(f'{__carconnectivity_version__} (HomeKit Plugin {__version__})', 'Till Steinbach', 'CarConnectivity', None)
 
         self.car_connectivity: CarConnectivity = car_connectivity
-        self.ignore_vins: List[str] = ignore_vins or []
-        self.ignore_accessory_types: List[str] = ignore_accessory_types or []
+        self.ignore_vins: FrozenSet[str] = frozenset(ignore_vins or ())
+        self.ignore_accessory_types: FrozenSet[str] = frozenset(ignore_accessory_types or ())
 
         self.driver: AccessoryDriver = driver
 
         self.accessory_config_file: str = accessory_config_file
         self.__accessory_config: Dict[str, Dict[str, Any]] = {}
+        # Guards the accessory config, the persist timer and the flags below
+        self.__persist_lock: threading.Lock = threading.Lock()
+        # Serialises writes of the accessory config file
+        self.__write_lock: threading.Lock = threading.Lock()
+        self.__persist_timer: Optional[threading.Timer] = None
+        self.__driver_config_changed: bool = False
+        self.__config_unsaved: bool = False
+        self.__commit_lock: threading.Lock = threading.Lock()
+        self.__batch_depth: int = 0
+        self.__config_dirty: bool = False
+        self.__vehicle_info: Dict[str, Tuple[Optional[str], str, str, str]] = {}
         self.next_aid: int = 100
         try:
             self.read_config()
@@ -57,6 +101,10 @@ class CarConnectivityBridge(Bridge):
             pass
 
         for identifier, accessory in self.__accessory_config.items():
+            # Accessories that are ignored by configuration will never be replaced, so there is no need to reserve them
+            vin, _, id_str = identifier.rpartition('-')
+            if vin in self.ignore_vins or id_str in self.ignore_accessory_types or 'aid' not in accessory:
+                continue
             if 'ConfiguredName' in accessory:
                 display_name = accessory['ConfiguredName']
             else:
@@ -85,34 +133,97 @@ class CarConnectivityBridge(Bridge):
 
     def __on_garage_update(self, element: Any, flags: Observable.ObserverEvent) -> None:
         """Update the accessories when the garage is updated."""
-        if (flags & (Observable.ObserverEvent.ENABLED)) and isinstance(element, GenericVehicle):
-            self.update(vehicle=element)
+        if not flags & _OBSERVER_ENABLED:
+            return
+        # Enabled events of other garage children are not of interest
+        if not isinstance(element, GenericVehicle):
+            return
+        self.update(vehicle=element)
+
+    def persist_config(self, delay: float = 0.5) -> None:
+        """
+        Schedule persisting the accessory configuration to a file.
+
+        Calls arriving while a write is already pending are coalesced, so a burst of configuration changes
+        results in only a single write of the configuration file after `delay` seconds.
+
+        Args:
+            delay (float, optional): Time in seconds to wait before writing the configuration. Defaults to 0.5.
+        """
+        with self.__persist_lock:
+            if self.__persist_timer is None:
+                self.__persist_timer = threading.Timer(interval=delay, function=self.__do_persist_config)
+                self.__persist_timer.daemon = True
+                self.__persist_timer.start()
+
+    def flush_config(self) -> None:
+        """
+        Write a pending accessory configuration immediately.
 
-    def persist_config(self) -> None:
+        If a write was scheduled by `persist_config`, the timer is cancelled. Unsaved changes, including those of an earlier write
+        that failed, are written synchronously. This is used on shutdown to not lose changes that are still pending.
+        """
+        with self.__persist_lock:
+            if self.__persist_timer is not None:
+                self.__persist_timer.cancel()
+                self.__persist_timer = None
+            if not self.__config_unsaved and not self.__driver_config_changed:
+                return
+        self.__do_persist_config()
+
+    def __do_persist_config(self) -> None:
         """
         Persist the accessory configuration to a file.
 
         This method writes the accessory configuration to the file specified by
-        `self.accessory_config_file` in JSON format. If the file cannot be written,
-        an error message is logged.
-
-        Raises:
-            ValueError: If there is an error during the JSON serialization process.
+        `self.accessory_config_file` in JSON format. The configuration is serialized with orjson if available
+        (stdlib json otherwise) and written in a single call to a temporary file that then atomically replaces the configuration.
+        The configuration is serialized under the same lock that guards its modifications, and writes never run concurrently.
+        If the file cannot be written, an error message is logged. Nothing is written if the configuration did not change since the last write.
+        If the accessories of the bridge changed since the last write, the driver is notified first.
         """
-        if self.accessory_config_file:
-            try:
-                with open(file=self.accessory_config_file, mode='w', encoding='utf8') as file:
-                    json.dump(self.__accessory_config, fp=file)
-                LOG.info('Writing accessory config file %s', self.accessory_config_file)
-            except ValueError as err:
-                LOG.info('Could not write homekit accessoryConfigFile %s (%s)', self.accessory_config_file, err)
+        with self.__write_lock:
+            data: Optional[bytes] = None
+            with self.__persist_lock:
+                self.__persist_timer = None
+                driver_config_changed: bool = self.__driver_config_changed
+                self.__driver_config_changed = False
+                config_unsaved: bool = self.__config_unsaved
+                self.__config_unsaved = False
+                if config_unsaved and self.accessory_config_file:
+                    try:
+                        data = _dumps(self.__accessory_config)
+                    except (ValueError, TypeError, RuntimeError) as err:
+                        LOG.info('Could not serialize homekit accessory config (%s)', err)
+                        # Try again with the next write
+                        self.__config_unsaved = True
+            if driver_config_changed:
+                try:
+                    self.driver.config_changed()
+                except RuntimeError as err:
+                    # On shutdown the event loop of the driver is already closed, the new config version is persisted anyway
+                    LOG.debug('Could not update the advertisement of the driver (%s)', err)
+            if data is not None:
+                try:
+                    # Write to a temporary file first and replace the config afterwards, so a crash never leaves a truncated config behind
+                    tmp_file: str = self.accessory_config_file + '.tmp'
+                    with open(file=tmp_file, mode='wb') as file:
+                        file.write(data)
+                    os.replace(tmp_file, self.accessory_config_file)
+                    LOG.info('Writing accessory config file %s', self.accessory_config_file)
+                except (ValueError, TypeError, RuntimeError, OSError) as err:
+                    LOG.info('Could not write homekit accessoryConfigFile %s (%s)', self.accessory_config_file, err)
+                    # Try again with the next write
+                    with self.__persist_lock:
+                        self.__config_unsaved = True
 
     def read_config(self):
         """
         Reads the accessory configuration from a JSON file and updates the accessory configuration attribute.
 
-        This method opens the accessory configuration file specified by `self.accessory_config_file`, reads its contents,
-        and loads it as a JSON object into `self.__accessory_config`. It also logs the action of reading the configuration file.
+        This method opens the accessory configuration file specified by `self.accessory_config_file`, reads its contents
+        in one go and loads it as a JSON object into `self.__accessory_config` (using orjson if available).
+        It also logs the action of reading the configuration file.
         Additionally, it iterates through the accessory configurations and updates `self.next_aid` to ensure it is set to
         one more than the highest 'aid' value found in the configurations.
 
@@ -120,15 +231,15 @@ class CarConnectivityBridge(Bridge):
             FileNotFoundError: If the accessory configuration file does not exist.
             json.JSONDecodeError: If the file contents cannot be decoded as JSON.
         """
-        with open(file=self.accessory_config_file, mode='r', encoding='utf8') as file:
-            self.__accessory_config = json.load(fp=file)
+        with open(file=self.accessory_config_file, mode='rb') as file:
+            self.__accessory_config = _loads(file.read())
             LOG.info('Reading homekit accessory config file %s', self.accessory_config_file)
             # Find the highest aid in the config and adjust next_aid accordingly
-            for accessory_config in self.__accessory_config.values():
-                if 'aid' in accessory_config and (accessory_config['aid'] + 1) > self.next_aid:
-                    self.next_aid = accessory_config['aid'] + 1
+            highest_aid: int = max((accessory_config['aid'] for accessory_config in self.__accessory_config.values()
+                                    if accessory_config.get('aid') is not None), default=-1)
+            self.next_aid = max(self.next_aid, highest_aid + 1)
 
-    def update(self, vehicle: GenericVehicle):  # noqa: C901 # pylint: disable=too-many-branches,too-many-statements,too-many-locals
+    def update(self, vehicle: GenericVehicle):  # pylint: disable=too-many-locals
         """
         Update the bridge with the given vehicle's information and accessories.
 
@@ -145,6 +256,7 @@ class CarConnectivityBridge(Bridge):
             - OutsideTemperatureAccessory
             - FlashingLightAccessory
             - LockingAccessory
+            - WindowHeatingAccessory
         4. If any configuration changes are made, updates the driver and persists the configuration.
 
         Note:
@@ -152,268 +264,176 @@ class CarConnectivityBridge(Bridge):
             - If an accessory is known but not of the correct type, it is replaced.
             - The method logs debug information and persists configuration changes if any updates are made.
         """
+        vin_attribute = vehicle.vin
+        if not vehicle.enabled or not vin_attribute.enabled or vin_attribute.value is None:
+            return
         config_changed = False
-        if vehicle.enabled and vehicle.vin.enabled and vehicle.vin.value is not None:
-            vin: str = vehicle.vin.value
-            if vin in self.ignore_vins:
-                LOG.debug('Ignoring vehicle with VIN %s due to configuration', vin)
-                return
-            if vehicle.manufacturer.enabled and vehicle.manufacturer.value is not None:
-                manufacturer: str = vehicle.manufacturer.value
-                vehicle.manufacturer.add_observer(self.__on_vehicle_update, Observable.ObserverEvent.VALUE_CHANGED)
-            else:
-                manufacturer: str = 'Unknown'
-                vehicle.manufacturer.add_observer(self.__on_vehicle_update, Observable.ObserverEvent.ENABLED)
-            if vehicle.name.enabled and vehicle.name.value is not None and len(vehicle.name.value) > 0:
-                name: str = vehicle.name.value
-                vehicle.name.add_observer(self.__on_vehicle_update, Observable.ObserverEvent.VALUE_CHANGED)
-            else:
-                name: str = vin
-                vehicle.name.add_observer(self.__on_vehicle_update, Observable.ObserverEvent.ENABLED)
-            if vehicle.model.enabled and vehicle.model.value is not None and len(vehicle.model.value) > 0:
-                model: str = vehicle.model.value
-                vehicle.model.add_observer(self.__on_vehicle_update, Observable.ObserverEvent.VALUE_CHANGED)
-            else:
-                model: str = 'Unknown'
-                vehicle.model.add_observer(self.__on_vehicle_update, Observable.ObserverEvent.ENABLED)
-            if vehicle.software is not None and vehicle.software.enabled and vehicle.software.version is not None and vehicle.software.version.enabled:
-                vehicle_software_version: Optional[str] = vehicle.software.version.value
-                vehicle.software.version.add_observer(self.__on_vehicle_update, Observable.ObserverEvent.VALUE_CHANGED)
-            else:
-                vehicle_software_version: Optional[str] = None
-                vehicle.software.version.add_observer(self.__on_vehicle_update, Observable.ObserverEvent.ENABLED)
-            # Climatization
-            climatization_aid: Optional[int] = self.get_existing_aid('Climatization', vin)
-            # pylint: disable-next=too-many-boolean-expressions
-            if 'Climatization' not in self.ignore_accessory_types:
-                if vehicle.climatization is not None and vehicle.climatization.enabled:
-                    if climatization_aid is None or climatization_aid not in self.accessories \
-                            or not isinstance(self.accessories[climatization_aid], ClimatizationAccessory):
-                        climatization_accessory: ClimatizationAccessory = ClimatizationAccessory(driver=self.driver, bridge=self,
-                                                                                                 aid=self.select_aid('Climatization', vin),
-                                                                                                 id_str='Climatization',
-                                                                                                 vin=vin,
-                                                                                                 display_name=f'{name} Climatization',
-                                                                                                 vehicle=vehicle)
-                        climatization_accessory.set_info_service(firmware_revision=vehicle_software_version, manufacturer=manufacturer, model=model,
-                                                                 serial_number=f'{vin}-climatization')
-                        self.set_config_item(climatization_accessory.id_str, climatization_accessory.vin, 'category', climatization_accessory.category)
-                        self.set_config_item(climatization_accessory.id_str, climatization_accessory.vin, 'services',
-                                             [service.display_name for service in climatization_accessory.services])
-                        # Add the accessory to the bridge if not known
-                        if climatization_accessory.aid not in self.accessories:
-                            self.add_accessory(climatization_accessory)
-                        # Replace the accessory if it is known but not of the correct type (was Dummy before)
-                        else:
-                            self.accessories[climatization_accessory.aid] = climatization_accessory
-                        config_changed = True
-                    elif climatization_aid in self.accessories:
-                        climatization_accessory: ClimatizationAccessory = self.accessories[climatization_aid]
-                        climatization_accessory.set_info_service(firmware_revision=vehicle_software_version, manufacturer=manufacturer, model=model,
-                                                                 serial_number=f'{vin}-climatization')
-                        config_changed = True
-                else:
-                    vehicle.climatization.add_observer(self.__on_vehicle_update, Observable.ObserverEvent.ENABLED)
-
-            # Charging
-            charging_aid: Optional[int] = self.get_existing_aid('Charging', vin)
-            # pylint: disable-next=too-many-boolean-expressions
-            if 'Charging' not in self.ignore_accessory_types:
-                if isinstance(vehicle, ElectricVehicle) and vehicle.charging is not None and vehicle.charging.enabled:
-                    if charging_aid is None or charging_aid not in self.accessories or not isinstance(self.accessories[charging_aid], ChargingAccessory):
-                        charging_accessory: ChargingAccessory = ChargingAccessory(driver=self.driver, bridge=self, aid=self.select_aid('Charging', vin),
-                                                                                  id_str='Charging', vin=vin, display_name=f'{name} Charging', vehicle=vehicle)
-                        charging_accessory.set_info_service(firmware_revision=vehicle_software_version, manufacturer=manufacturer, model=model,
-                                                            serial_number=f'{vin}-charging')
-                        self.set_config_item(charging_accessory.id_str, charging_accessory.vin, 'category', charging_accessory.category)
-                        self.set_config_item(charging_accessory.id_str, charging_accessory.vin, 'services',
-                                             [service.display_name for service in charging_accessory.services])
-                        # Add the accessory to the bridge if not known
-                        if charging_accessory.aid not in self.accessories:
-                            self.add_accessory(charging_accessory)
-                        # Replace the accessory if it is known but not of the correct type (was Dummy before)
-                        else:
-                            self.accessories[charging_accessory.aid] = charging_accessory
-                        config_changed = True
-                    elif charging_aid in self.accessories:
-                        charging_accessory: ChargingAccessory = self.accessories[charging_aid]
-                        charging_accessory.set_info_service(firmware_revision=vehicle_software_version, manufacturer=manufacturer, model=model,
-                                                            serial_number=f'{vin}-charging')
-                        config_changed = True
-                else:
-                    if isinstance(vehicle, ElectricVehicle) and vehicle.charging is not None:
-                        vehicle.charging.add_observer(self.__on_vehicle_update, Observable.ObserverEvent.ENABLED)
-
-            # ChargingPlug
-            plug_aid: Optional[int] = self.get_existing_aid('ChargingPlug', vin)
-            # pylint: disable-next=too-many-boolean-expressions
-            if 'ChargingPlug' not in self.ignore_accessory_types:
-                if isinstance(vehicle, ElectricVehicle) and vehicle.charging is not None and vehicle.charging.enabled:
-                    if plug_aid is None or plug_aid not in self.accessories or not isinstance(self.accessories[plug_aid], ChargingPlugAccessory):
-                        charging_plug_accessory: ChargingPlugAccessory = ChargingPlugAccessory(driver=self.driver, bridge=self,
-                                                                                               aid=self.select_aid('ChargingPlug', vin),
-                                                                                               id_str='ChargingPlug',
-                                                                                               vin=vin,
-                                                                                               display_name=f'{name} Charging Plug',
-                                                                                               vehicle=vehicle)
-                        charging_plug_accessory.set_info_service(firmware_revision=vehicle_software_version, manufacturer=manufacturer, model=model,
-                                                                 serial_number=f'{vin}-charging-plug')
-                        self.set_config_item(charging_plug_accessory.id_str, charging_plug_accessory.vin, 'category', charging_plug_accessory.category)
-                        self.set_config_item(charging_plug_accessory.id_str, charging_plug_accessory.vin, 'services',
-                                             [service.display_name for service in charging_plug_accessory.services])
-                        # Add the accessory to the bridge if not known
-                        if charging_plug_accessory.aid not in self.accessories:
-                            self.add_accessory(charging_plug_accessory)
-                        # Replace the accessory if it is known but not of the correct type (was Dummy before)
-                        else:
-                            self.accessories[charging_plug_accessory.aid] = charging_plug_accessory
-                        config_changed = True
-                    elif plug_aid in self.accessories:
-                        charging_plug_accessory: ChargingPlugAccessory = self.accessories[plug_aid]
-                        charging_plug_accessory.set_info_service(firmware_revision=vehicle_software_version, manufacturer=manufacturer, model=model,
-                                                                 serial_number=f'{vin}-charging-plug')
-                        config_changed = True
-                else:
-                    if isinstance(vehicle, ElectricVehicle) and vehicle.charging is not None:
-                        vehicle.charging.add_observer(self.__on_vehicle_update, Observable.ObserverEvent.ENABLED)
-
-            # OutsideTemperature
-            outside_temperature_aid: Optional[int] = self.get_existing_aid('OutsideTemperature', vin)
-            # pylint: disable-next=too-many-boolean-expressions
-            if 'OutsideTemperature' not in self.ignore_accessory_types:
-                if vehicle.outside_temperature is not None and vehicle.outside_temperature.enabled:
-                    if outside_temperature_aid is None or outside_temperature_aid not in self.accessories \
-                            or not isinstance(self.accessories[outside_temperature_aid], OutsideTemperatureAccessory):
-                        outside_temperature_accessory: OutsideTemperatureAccessory = OutsideTemperatureAccessory(driver=self.driver, bridge=self,
-                                                                                                                 aid=self.select_aid('OutsideTemperature', vin),
-                                                                                                                 id_str='OutsideTemperature',
-                                                                                                                 vin=vin,
-                                                                                                                 display_name=f'{name} Outside Temperature',
-                                                                                                                 vehicle=vehicle)
-                        outside_temperature_accessory.set_info_service(firmware_revision=vehicle_software_version, manufacturer=manufacturer, model=model,
-                                                                       serial_number=f'{vin}-outside-temperature')
-                        self.set_config_item(outside_temperature_accessory.id_str, outside_temperature_accessory.vin, 'category',
-                                             outside_temperature_accessory.category)
-                        self.set_config_item(outside_temperature_accessory.id_str, outside_temperature_accessory.vin, 'services',
-                                             [service.display_name for service in outside_temperature_accessory.services])
-                        # Add the accessory to the bridge if not known
-                        if outside_temperature_accessory.aid not in self.accessories:
-                            self.add_accessory(outside_temperature_accessory)
-                        # Replace the accessory if it is known but not of the correct type (was Dummy before)
-                        else:
-                            self.accessories[outside_temperature_accessory.aid] = outside_temperature_accessory
-                        config_changed = True
-                    elif outside_temperature_aid in self.accessories:
-                        outside_temperature_accessory: OutsideTemperatureAccessory = self.accessories[outside_temperature_aid]
-                        outside_temperature_accessory.set_info_service(firmware_revision=vehicle_software_version, manufacturer=manufacturer, model=model,
-                                                                       serial_number=f'{vin}-outside-temperature')
-                        config_changed = True
-                else:
-                    vehicle.outside_temperature.add_observer(self.__on_vehicle_update, Observable.ObserverEvent.ENABLED)
-
-            # FlashingAccessory
-            flashing_light_aid: Optional[int] = self.get_existing_aid('FlashingLight', vin)
-            # pylint: disable-next=too-many-boolean-expressions
-            if 'FlashingLight' not in self.ignore_accessory_types:
-                if vehicle.commands is not None and vehicle.commands is not None and 'honk-flash' in vehicle.commands.commands:
-                    if flashing_light_aid is None or flashing_light_aid not in self.accessories \
-                            or not isinstance(self.accessories[flashing_light_aid], FlashingLightAccessory):
-                        flashing_light_accessory: FlashingLightAccessory = FlashingLightAccessory(driver=self.driver, bridge=self,
-                                                                                                  aid=self.select_aid('FlashingLight', vin),
-                                                                                                  id_str='FlashingLight',
-                                                                                                  vin=vin,
-                                                                                                  display_name=f'{name} Flashing',
-                                                                                                  vehicle=vehicle)
-                        flashing_light_accessory.set_info_service(firmware_revision=vehicle_software_version, manufacturer=manufacturer, model=model,
-                                                                  serial_number=f'{vin}-flashing-light')
-                        self.set_config_item(flashing_light_accessory.id_str, flashing_light_accessory.vin, 'category',
-                                             flashing_light_accessory.category)
-                        self.set_config_item(flashing_light_accessory.id_str, flashing_light_accessory.vin, 'services',
-                                             [service.display_name for service in flashing_light_accessory.services])
-                        # Add the accessory to the bridge if not known
-                        if flashing_light_accessory.aid not in self.accessories:
-                            self.add_accessory(flashing_light_accessory)
-                        # Replace the accessory if it is known but not of the correct type (was Dummy before)
-                        else:
-                            self.accessories[flashing_light_accessory.aid] = flashing_light_accessory
-                        config_changed = True
-                    elif flashing_light_aid in self.accessories:
-                        flashing_light_accessory: FlashingLightAccessory = self.accessories[flashing_light_aid]
-                        flashing_light_accessory.set_info_service(firmware_revision=vehicle_software_version, manufacturer=manufacturer, model=model,
-                                                                  serial_number=f'{vin}-flashing-light')
-                        config_changed = True
-                else:
-                    if vehicle.commands is not None:
-                        vehicle.commands.add_observer(self.__on_vehicle_update, Observable.ObserverEvent.ENABLED)
-
-            # LockingAccessory
-            locking_aid: Optional[int] = self.get_existing_aid('Locking', vin)
-            # pylint: disable-next=too-many-boolean-expressions
-            if 'Locking' not in self.ignore_accessory_types:
-                if vehicle.doors is not None and vehicle.doors.commands is not None \
-                        and 'lock-unlock' in vehicle.doors.commands.commands:
-                    if locking_aid is None or locking_aid not in self.accessories or not isinstance(self.accessories[locking_aid],
-                                                                                                    LockingAccessory):
-                        locking_accessory: LockingAccessory = LockingAccessory(driver=self.driver, bridge=self, aid=self.select_aid('Locking', vin),
-                                                                               id_str='Locking', vin=vin, display_name=f'{name} Locking', vehicle=vehicle)
-                        locking_accessory.set_info_service(firmware_revision=vehicle_software_version, manufacturer=manufacturer, model=model,
-                                                           serial_number=f'{vin}-locking')
-                        self.set_config_item(locking_accessory.id_str, locking_accessory.vin, 'category', locking_accessory.category)
-                        self.set_config_item(locking_accessory.id_str, locking_accessory.vin, 'services',
-                                             [service.display_name for service in locking_accessory.services])
-                        # Add the accessory to the bridge if not known
-                        if locking_accessory.aid not in self.accessories:
-                            self.add_accessory(locking_accessory)
-                        # Replace the accessory if it is known but not of the correct type (was Dummy before)
-                        else:
-                            self.accessories[locking_accessory.aid] = locking_accessory
-                        config_changed = True
-                    elif locking_aid in self.accessories:
-                        locking_accessory: LockingAccessory = self.accessories[locking_aid]
-                        locking_accessory.set_info_service(firmware_revision=vehicle_software_version, manufacturer=manufacturer, model=model,
-                                                           serial_number=f'{vin}-locking')
-                        config_changed = True
-                else:
-                    if vehicle.doors is not None and vehicle.doors.commands is not None:
-                        vehicle.doors.commands.add_observer(self.__on_vehicle_update, Observable.ObserverEvent.ENABLED)
-
-            # Window Heating
-            window_heating_aid: Optional[int] = self.get_existing_aid('Window Heating', vin)
-            # pylint: disable-next=too-many-boolean-expressions
-            if 'Charging' not in self.ignore_accessory_types:
-                if vehicle.window_heatings is not None and vehicle.window_heatings.enabled:
-                    if window_heating_aid is None or window_heating_aid not in self.accessories \
-                            or not isinstance(self.accessories[window_heating_aid], WindowHeatingAccessory):
-                        window_heating_accessory: WindowHeatingAccessory = WindowHeatingAccessory(driver=self.driver, bridge=self,
-                                                                                                  aid=self.select_aid('Window Heating', vin),
-                                                                                                  id_str='Window Heating',
-                                                                                                  vin=vin,
-                                                                                                  display_name=f'{name} Window Heating',
-                                                                                                  vehicle=vehicle)
-                        window_heating_accessory.set_info_service(firmware_revision=vehicle_software_version, manufacturer=manufacturer, model=model,
-                                                                  serial_number=f'{vin}-window-heating')
-                        self.set_config_item(window_heating_accessory.id_str, window_heating_accessory.vin, 'category', window_heating_accessory.category)
-                        self.set_config_item(window_heating_accessory.id_str, window_heating_accessory.vin, 'services',
-                                             [service.display_name for service in window_heating_accessory.services])
-                        # Add the accessory to the bridge if not known
-                        if window_heating_accessory.aid not in self.accessories:
-                            self.add_accessory(window_heating_accessory)
-                        # Replace the accessory if it is known but not of the correct type (was Dummy before)
-                        else:
-                            self.accessories[window_heating_accessory.aid] = window_heating_accessory
-                        config_changed = True
-                    elif window_heating_aid in self.accessories:
-                        window_heating_accessory: WindowHeatingAccessory = self.accessories[window_heating_aid]
-                        window_heating_accessory.set_info_service(firmware_revision=vehicle_software_version, manufacturer=manufacturer, model=model,
-                                                                  serial_number=f'{vin}-window-heating')
-                        config_changed = True
-                else:
-                    if vehicle.window_heatings is not None:
-                        vehicle.window_heatings.add_observer(self.__on_vehicle_update, Observable.ObserverEvent.ENABLED)
+        vin: str = vin_attribute.value
+        if vin in self.ignore_vins:
+            LOG.debug('Ignoring vehicle with VIN %s due to configuration', vin)
+            return
+        manufacturer: str = self.__observe_value(vehicle.manufacturer, default='Unknown')
+        name: str = self.__observe_value(vehicle.name, default=vin, nonempty=True)
+        model: str = self.__observe_value(vehicle.model, default='Unknown', nonempty=True)
+        if vehicle.software is not None and vehicle.software.enabled and vehicle.software.version is not None and vehicle.software.version.enabled:
+            vehicle_software_version: Optional[str] = vehicle.software.version.value
+            vehicle.software.version.add_observer(self.__on_vehicle_update, Observable.ObserverEvent.VALUE_CHANGED)
+        else:
+            vehicle_software_version: Optional[str] = None
+            vehicle.software.version.add_observer(self.__on_vehicle_update, Observable.ObserverEvent.ENABLED)
+        vehicle_info: Tuple[Optional[str], str, str, str] = (vehicle_software_version, manufacturer, model, name)
+        info_changed: bool = self.__vehicle_info.get(vin) != vehicle_info
+        self.__vehicle_info[vin] = vehicle_info
+        is_electric: bool = isinstance(vehicle, ElectricVehicle)
+        charging_available: bool = is_electric and vehicle.charging is not None and vehicle.charging.enabled
+        commands: Optional[Commands] = vehicle.commands
+        doors_commands: Optional[Commands] = vehicle.doors.commands if vehicle.doors is not None else None
+        # (id_str, accessory class, available, observable to watch while not available, display name suffix, serial number suffix)
+        accessory_specs: List[Tuple[str, Type[GenericAccessory], bool, Optional[Observable], str, str]] = [
+            ('Climatization', ClimatizationAccessory, vehicle.climatization is not None and vehicle.climatization.enabled, vehicle.climatization,
+             'Climatization', 'climatization'),
+            ('Charging', ChargingAccessory, charging_available, vehicle.charging if is_electric else None, 'Charging', 'charging'),
+            ('ChargingPlug', ChargingPlugAccessory, charging_available, vehicle.charging if is_electric else None, 'Charging Plug', 'charging-plug'),
+            ('OutsideTemperature', OutsideTemperatureAccessory, vehicle.outside_temperature is not None and vehicle.outside_temperature.enabled,
+             vehicle.outside_temperature, 'Outside Temperature', 'outside-temperature'),
+            ('FlashingLight', FlashingLightAccessory, commands is not None and 'honk-flash' in commands.commands, commands, 'Flashing',
+             'flashing-light'),
+            ('Locking', LockingAccessory, doors_commands is not None and 'lock-unlock' in doors_commands.commands, doors_commands, 'Locking',
+             'locking'),
+            ('Window Heating', WindowHeatingAccessory, vehicle.window_heatings is not None and vehicle.window_heatings.enabled, vehicle.window_heatings,
+             'Window Heating', 'window-heating'),
+        ]
+        ignore_accessory_types: FrozenSet[str] = self.ignore_accessory_types
+        install_accessory = self.__install_accessory
+        for id_str, accessory_class, available, observable, display_suffix, serial_suffix in accessory_specs:
+            if id_str in ignore_accessory_types:
+                continue
+            if available:
+                config_changed |= install_accessory(vehicle=vehicle, vin=vin, vehicle_info=vehicle_info, info_changed=info_changed, id_str=id_str,
+                                                    accessory_class=accessory_class, display_suffix=display_suffix, serial_suffix=serial_suffix)
+            elif observable is not None:
+                observable.add_observer(self.__on_vehicle_update, Observable.ObserverEvent.ENABLED)
 
         if config_changed:
-            self.driver.config_changed()
-            LOG.debug('Config changed, updating driver and persisting config')
+            with self.__commit_lock:
+                self.__config_dirty = True
+            self.__commit_config()
+
+    # pylint: disable-next=too-many-arguments
+    def __install_accessory(self, vehicle: GenericVehicle, vin: str, vehicle_info: Tuple[Optional[str], str, str, str], info_changed: bool, id_str: str,
+                            accessory_class: Type[GenericAccessory], display_suffix: str, serial_suffix: str) -> bool:
+        """
+        Add or refresh a single accessory of a vehicle on the bridge.
+
+        If no accessory of `accessory_class` is known for the vehicle, it is created and added to the bridge (replacing a placeholder
+        if there is one). Otherwise the accessory information of the existing accessory is refreshed if it changed.
+
+        Args:
+            vehicle (GenericVehicle): The vehicle the accessory belongs to.
+            vin (str): The vehicle identification number.
+            vehicle_info (Tuple[Optional[str], str, str, str]): Software version, manufacturer, model and name of the vehicle.
+            info_changed (bool): Whether `vehicle_info` changed since the last update.
+            id_str (str): The identifier string of the accessory type.
+            accessory_class (Type[GenericAccessory]): The class of the accessory.
+            display_suffix (str): Appended to the vehicle name to form the display name of the accessory.
+            serial_suffix (str): Appended to the VIN to form the serial number of the accessory.
+
+        Returns:
+            bool: True if the configuration of the bridge changed, otherwise False.
+        """
+        vehicle_software_version, manufacturer, model, name = vehicle_info
+        aid: Optional[int] = self.get_existing_aid(id_str, vin)
+        existing_accessory: Optional[Accessory] = self.accessories.get(aid)
+        if not isinstance(existing_accessory, accessory_class):
+            if aid is None:
+                aid = self.select_aid(id_str, vin)
+            accessory: GenericAccessory = accessory_class(driver=self.driver, bridge=self, aid=aid, id_str=id_str, vin=vin,
+                                                          display_name=f'{name} {display_suffix}', vehicle=vehicle)
+            accessory.set_info_service(firmware_revision=vehicle_software_version, manufacturer=manufacturer, model=model,
+                                       serial_number=f'{vin}-{serial_suffix}')
+            self.update_accessory_config(accessory)
+            # Add the accessory to the bridge if not known
+            if existing_accessory is None:
+                self.add_accessory(accessory)
+            # Replace the accessory if it is known but not of the correct type (was Dummy before)
+            else:
+                self.accessories[accessory.aid] = accessory
+            return True
+        # Only refresh the accessory information if it changed since the last update
+        if info_changed:
+            existing_accessory.set_info_service(firmware_revision=vehicle_software_version, manufacturer=manufacturer, model=model,
+                                                serial_number=f'{vin}-{serial_suffix}')
+            return True
+        return False
+
+    def __observe_value(self, attribute: GenericAttribute, default: Any, nonempty: bool = False) -> Any:
+        """
+        Get the value of a vehicle attribute and observe it for changes.
+
+        If the attribute is enabled and has a value (non-empty if `nonempty` is set), its value is returned and the bridge
+        observes value changes. Otherwise `default` is returned and the bridge observes the attribute becoming enabled.
+
+        Args:
+            attribute (GenericAttribute): The attribute to read and observe.
+            default (Any): The value to return if the attribute has no usable value.
+            nonempty (bool, optional): Treat an empty value as not available. Defaults to False.
+
+        Returns:
+            Any: The value of the attribute or `default`.
+        """
+        value: Any = attribute.value
+        if attribute.enabled and value is not None and (not nonempty or len(value) > 0):
+            attribute.add_observer(self.__on_vehicle_update, Observable.ObserverEvent.VALUE_CHANGED)
+            return value
+        attribute.add_observer(self.__on_vehicle_update, Observable.ObserverEvent.ENABLED)
+        return default
+
+    @contextmanager
+    def batch_update(self) -> Iterator[None]:
+        """
+        Context manager to batch several calls to `update`.
+
+        While the context is active, configuration changes made by `update` are only collected. The driver is notified
+        and the configuration is persisted once when the outermost context is left.
+        """
+        with self.__commit_lock:
+            self.__batch_depth += 1
+        try:
+            yield
+        finally:
+            with self.__commit_lock:
+                self.__batch_depth -= 1
+            self.__commit_config()
+
+    def __commit_config(self) -> None:
+        """
+        Schedule notifying the driver and persisting the configuration if it changed and no batch is active.
+
+        The driver is notified together with the next write of the configuration, so bursts of changes result in a single notification.
+        """
+        with self.__commit_lock:
+            if self.__batch_depth > 0 or not self.__config_dirty:
+                return
+            self.__config_dirty = False
+        with self.__persist_lock:
+            self.__driver_config_changed = True
+        self.persist_config()
+        LOG.debug('Config changed, updating driver and persisting config')
+
+    def update_accessory_config(self, accessory: GenericAccessory) -> bool:
+        """
+        Store category and services of an accessory in the accessory configuration.
+
+        The values are only written if they differ from the stored ones.
+
+        Args:
+            accessory (GenericAccessory): The accessory to store the configuration for.
+
+        Returns:
+            bool: True if the stored configuration was changed, otherwise False.
+        """
+        return self.set_config_items(accessory.id_str, accessory.vin, {'category': accessory.category,
+                                                                       'services': [service.display_name for service in accessory.services]})
 
     def get_existing_aid(self, id_str: str, vin: str) -> Optional[int]:
         """
@@ -426,12 +446,10 @@ class CarConnectivityBridge(Bridge):
         Returns:
             Optional[int]: The accessory ID (AID) if it exists, otherwise None.
         """
-        identifier = f'{vin}-{id_str}'
-        aid: Optional[int] = None
-        if identifier in self.__accessory_config and 'aid' in self.__accessory_config[identifier] \
-                and self.__accessory_config[identifier]['aid'] is not None:
-            aid = self.__accessory_config[identifier]['aid']
-        return aid
+        accessory_config: Optional[Dict[str, Any]] = self.__accessory_config.get(_identifier(vin, id_str))
+        if accessory_config is None:
+            return None
+        return accessory_config.get('aid')
 
     def select_aid(self, id_str: str, vin: str) -> int:
         """
@@ -449,22 +467,22 @@ class CarConnectivityBridge(Bridge):
         Returns:
             int: The accessory ID (aid) for the given accessory identifier.
         """
-        aid = self.get_existing_aid(id_str=id_str, vin=vin)
-        identifier = f'{vin}-{id_str}'
-        if aid is None:
-            new_aid: int = self.next_aid
-            self.next_aid += 1
-            if identifier in self.__accessory_config:
-                self.__accessory_config[identifier]['aid'] = new_aid
-            else:
-                self.__accessory_config[identifier] = {'aid': new_aid}
-            return new_aid
+        with self.__persist_lock:
+            accessory_config: Dict[str, Any] = self.__accessory_config.setdefault(_identifier(vin, id_str), {})
+            aid: Optional[int] = accessory_config.get('aid')
+            if aid is None:
+                aid = self.next_aid
+                self.next_aid += 1
+                accessory_config['aid'] = aid
+                self.__config_unsaved = True
         return aid
 
-    def set_config_item(self, id_str: str, vin: str, config_key: str, item: Any) -> None:
+    def set_config_item(self, id_str: str, vin: str, config_key: str, item: Any) -> bool:
         """
         Set a configuration item for a specific accessory identified by a combination of VIN and ID string.
 
+        The item is only written if it differs from the stored value.
+
         Args:
             id_str (str): The identifier string for the accessory.
             vin (str): The vehicle identification number.
@@ -472,14 +490,40 @@ class CarConnectivityBridge(Bridge):
             item (Any): The value to be set for the configuration item.
 
         Returns:
-            None
+            bool: True if the stored value was changed, otherwise False.
         """
-        identifier: str = f'{vin}-{id_str}'
-        if identifier in self.__accessory_config:
-            self.__accessory_config[identifier][config_key] = item
-        else:
-            self.__accessory_config[identifier] = {config_key: item}
-        self.next_aid += 1
+        with self.__persist_lock:
+            accessory_config: Dict[str, Any] = self.__accessory_config.setdefault(_identifier(vin, id_str), {})
+            if config_key in accessory_config and accessory_config[config_key] == item:
+                return False
+            accessory_config[config_key] = item
+            self.__config_unsaved = True
+        return True
+
+    def set_config_items(self, id_str: str, vin: str, items: Dict[str, Any]) -> bool:
+        """
+        Set several configuration items for a specific accessory identified by a combination of VIN and ID string.
+
+        Only items that differ from the stored values are written.
+
+        Args:
+            id_str (str): The identifier string for the accessory.
+            vin (str): The vehicle identification number.
+            items (Dict[str, Any]): The configuration items to set, keyed by configuration key.
+
+        Returns:
+            bool: True if any stored value was changed, otherwise False.
+        """
+        changed: bool = False
+        with self.__persist_lock:
+            accessory_config: Dict[str, Any] = self.__accessory_config.setdefault(_identifier(vin, id_str), {})
+            for config_key, item in items.items():
+                if config_key not in accessory_config or accessory_config[config_key] != item:
+                    accessory_config[config_key] = item
+                    changed = True
+            if changed:
+                self.__config_unsaved = True
+        return changed
 
     def get_config_item(self, id_str: str, vin: str, config_key: str) -> Optional[Any]:
         """
@@ -493,10 +537,10 @@ class CarConnectivityBridge(Bridge):
         Returns:
             Optional[Any]: The value of the configuration item if found, otherwise None.
         """
-        identifier: str = f'{vin}-{id_str}'
-        if identifier in self.__accessory_config and config_key in self.__accessory_config[identifier]:
-            return self.__accessory_config[identifier][config_key]
-        return None
+        accessory_config: Optional[Dict[str, Any]] = self.__accessory_config.get(_identifier(vin, id_str))
+        if accessory_config is None:
+            return None
+        return accessory_config.get(config_key)
 
     def __on_vehicle_update(self, element: Any, flags: Observable.ObserverEvent) -> None:
         """Update the accessories when the vehicle is updated."""
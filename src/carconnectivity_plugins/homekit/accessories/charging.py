@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import threading
+import time
 from datetime import datetime, timezone
 import logging
 
@@ -23,7 +24,9 @@ from carconnectivity.units import Power
 from carconnectivity_plugins.homekit.accessories.generic_accessory import BatteryGenericVehicleAccessory
 
 if TYPE_CHECKING:
-    from typing import Optional, Any, Dict
+    from typing import Optional, Any, Dict, FrozenSet
+
+    import asyncio
 
     from pyhap.service import Service
     from pyhap.accessory_driver import AccessoryDriver
@@ -35,6 +38,28 @@ if TYPE_CHECKING:
 
 LOG: logging.Logger = logging.getLogger("carconnectivity.plugins.homekit.charging")
 
+# Values written by HomeKit to the On characteristic that switch charging on
+_ON_VALUES: FrozenSet[int] = frozenset((1, 2, 3))
+
+# Value of the On characteristic for the supported charging states
+_CHARGING_STATE_TO_ON: Dict[Charging.ChargingState, int] = {
+    Charging.ChargingState.OFF: 0,
+    Charging.ChargingState.READY_FOR_CHARGING: 0,
+    Charging.ChargingState.CHARGING: 1,
+    Charging.ChargingState.DISCHARGING: 1,
+    Charging.ChargingState.CONSERVATION: 1,
+    Charging.ChargingState.ERROR: 0,
+    Charging.ChargingState.UNSUPPORTED: 0,
+}
+
+# Value of the OutletInUse characteristic for the supported connector states
+_CONNECTOR_STATE_TO_OUTLET_IN_USE: Dict[ChargingConnector.ChargingConnectorConnectionState, bool] = {
+    ChargingConnector.ChargingConnectorConnectionState.CONNECTED: True,
+    ChargingConnector.ChargingConnectorConnectionState.DISCONNECTED: False,
+    ChargingConnector.ChargingConnectorConnectionState.INVALID: False,
+    ChargingConnector.ChargingConnectorConnectionState.UNSUPPORTED: False,
+}
+
 
 class ChargingAccessory(BatteryGenericVehicleAccessory):  # pylint: disable=too-many-instance-attributes
     """Charging Accessory"""
@@ -46,7 +71,12 @@ class ChargingAccessory(BatteryGenericVehicleAccessory):  # pylint: disable=too-
                  vehicle: GenericVehicle) -> None:
         super().__init__(driver=driver, bridge=bridge, display_name=display_name, aid=aid, vin=vin, id_str=id_str, vehicle=vehicle)
 
-        self.update_remaining_duration_timer: Optional[threading.Timer] = None
+        # Handle of the periodic remaining duration update, scheduled on the event loop of the driver
+        self.update_remaining_duration_timer: Optional[asyncio.TimerHandle] = None
+        self.estimated_date_reached: Optional[datetime] = None
+        self.pending_estimated_date_reached: Optional[datetime] = None
+        self.remaining_duration_deadline: Optional[float] = None
+        self.estimated_date_reached_update_scheduled: bool = False
 
         # pyright: ignore[reportArgumentType]
         self.service: Optional[Service] = self.add_preload_service(service='Outlet',  # pyright: ignore[reportArgumentType]
@@ -60,10 +90,11 @@ class ChargingAccessory(BatteryGenericVehicleAccessory):  # pylint: disable=too-
 
         self.charging_start_stop_command: Optional[GenericCommand] = None
 
-        self.cc_charging_state_lock: threading.Lock = threading.Lock()
-        self.cc_date_reached_lock: threading.Lock = threading.Lock()
-        self.cc_power_lock: threading.Lock = threading.Lock()
-        self.cc_connector_state_lock: threading.Lock = threading.Lock()
+        # Reentrant, as observers may be notified again from within a callback on the same thread
+        self.cc_charging_state_lock: threading.RLock = threading.RLock()
+        self.cc_date_reached_lock: threading.RLock = threading.RLock()
+        self.cc_power_lock: threading.RLock = threading.RLock()
+        self.cc_connector_state_lock: threading.RLock = threading.RLock()
 
         self.add_name_characteristics()
         self.add_status_fault_characteristic()
@@ -71,7 +102,7 @@ class ChargingAccessory(BatteryGenericVehicleAccessory):  # pylint: disable=too-
 
         if self.vehicle is not None and isinstance(self.vehicle, ElectricVehicle) and self.vehicle.charging is not None:
             if self.vehicle.charging.state is not None:
-                self.vehicle.charging.state.add_observer(self.__on_cc_charging_state_change, flag=Observable.ObserverEvent.VALUE_CHANGED)
+                self._add_cc_observer(self.vehicle.charging.state, self.__on_cc_charging_state_change, flag=Observable.ObserverEvent.VALUE_CHANGED)
                 self.char_on = self.service.configure_char('On', setter_callback=self.__on_hk_on_change)
                 if self.vehicle.charging.state.enabled:
                     self.__on_cc_charging_state_change(self.vehicle.charging.state, Observable.ObserverEvent.VALUE_CHANGED)
@@ -82,22 +113,22 @@ class ChargingAccessory(BatteryGenericVehicleAccessory):  # pylint: disable=too-
                     self.charging_start_stop_command = self.vehicle.charging.commands.commands['start-stop']
 
             if self.vehicle.charging.estimated_date_reached is not None:
-                self.vehicle.charging.estimated_date_reached.add_observer(self.__on_cc_estimated_date_reached_change,
-                                                                          flag=Observable.ObserverEvent.UPDATED_NEW_MEASUREMENT)
+                self._add_cc_observer(self.vehicle.charging.estimated_date_reached, self.__on_cc_estimated_date_reached_change,
+                                      flag=Observable.ObserverEvent.UPDATED_NEW_MEASUREMENT)
                 self.char_remaining_duration = self.service.configure_char('RemainingDuration')
                 if self.vehicle.charging.estimated_date_reached.enabled:
                     self.__on_cc_estimated_date_reached_change(self.vehicle.charging.estimated_date_reached,
                                                                Observable.ObserverEvent.UPDATED_NEW_MEASUREMENT)
 
             if self.vehicle.charging.power is not None:
-                self.vehicle.charging.power.add_observer(self.__on_cc_power_change, flag=Observable.ObserverEvent.VALUE_CHANGED)
+                self._add_cc_observer(self.vehicle.charging.power, self.__on_cc_power_change, flag=Observable.ObserverEvent.VALUE_CHANGED)
                 self.char_consumption = self.service.configure_char('Consumption')
                 if self.vehicle.charging.power.enabled:
                     self.__on_cc_power_change(self.vehicle.charging.power, Observable.ObserverEvent.VALUE_CHANGED)
 
             if self.vehicle.charging.connector is not None and self.vehicle.charging.connector.connection_state is not None:
-                self.vehicle.charging.connector.connection_state.add_observer(self.__on_cc_connector_state_change,
-                                                                              flag=Observable.ObserverEvent.VALUE_CHANGED)
+                self._add_cc_observer(self.vehicle.charging.connector.connection_state, self.__on_cc_connector_state_change,
+                                      flag=Observable.ObserverEvent.VALUE_CHANGED)
                 self.char_outlet_in_use = self.service.configure_char('OutletInUse')
                 if self.vehicle.charging.connector.connection_state.enabled:
                     self.__on_cc_connector_state_change(self.vehicle.charging.connector.connection_state,
@@ -106,41 +137,31 @@ class ChargingAccessory(BatteryGenericVehicleAccessory):  # pylint: disable=too-
                     self.__on_cc_connector_state_change(ChargingConnector.ChargingConnectorConnectionState.UNKNOWN,
                                                         Observable.ObserverEvent.VALUE_CHANGED)
 
+    async def stop(self) -> None:
+        """Stops the accessory and cancels the periodic remaining duration update."""
+        await super().stop()
+        if self.update_remaining_duration_timer is not None:
+            self.update_remaining_duration_timer.cancel()
+            self.update_remaining_duration_timer = None
+
     def __on_cc_charging_state_change(self, element: Any, flags: Observable.ObserverEvent) -> None:
         with self.cc_charging_state_lock:
             if flags & Observable.ObserverEvent.VALUE_CHANGED:
                 if self.char_on is not None:
-                    if element.value is None:
-                        self.char_on.set_value(0)
-                    elif element.value in (Charging.ChargingState.OFF,
-                                           Charging.ChargingState.READY_FOR_CHARGING):
-                        self.char_on.set_value(0)
-                    elif element.value in (Charging.ChargingState.CHARGING,
-                                           Charging.ChargingState.DISCHARGING,
-                                           Charging.ChargingState.CONSERVATION):
-                        self.char_on.set_value(1)
-                    elif element.value in (Charging.ChargingState.ERROR,
-                                           Charging.ChargingState.UNSUPPORTED):
-                        self.char_on.set_value(0)
-                    else:
-                        self.char_on.set_value(0)
-                        LOG.warning('unsupported chargingState: %s', element.value.value)
+                    self._set_mapped_value(self.char_on, element.value, _CHARGING_STATE_TO_ON, default=0, logger=LOG,
+                                           description='chargingState')
             else:
                 LOG.debug('Unsupported event %s', flags)
 
     def __on_hk_on_change(self, value: Any) -> None:
         try:
             if self.charging_start_stop_command is not None and self.charging_start_stop_command.enabled:
-                if value in [1, 2, 3]:
+                if value in _ON_VALUES:
                     LOG.info('Switch charging on')
-                    command_args: Dict[str, Any] = {}
-                    command_args['command'] = ChargingStartStopCommand.Command.START
-                    self.charging_start_stop_command.value = command_args
+                    self.charging_start_stop_command.value = {'command': ChargingStartStopCommand.Command.START}
                 elif value == 0:
                     LOG.info('Switch charging off')
-                    command_args: Dict[str, Any] = {}
-                    command_args['command'] = ChargingStartStopCommand.Command.STOP
-                    self.charging_start_stop_command.value = command_args
+                    self.charging_start_stop_command.value = {'command': ChargingStartStopCommand.Command.STOP}
                 else:
                     LOG.error('Input for charging not understood: %d', value)
         except SetterError as setter_error:
@@ -152,30 +173,43 @@ class ChargingAccessory(BatteryGenericVehicleAccessory):  # pylint: disable=too-
             if flags & Observable.ObserverEvent.UPDATED_NEW_MEASUREMENT:
                 if self.char_remaining_duration is not None:
                     if element.enabled and element.value is not None and isinstance(element.value, datetime):
-                        self.estimated_date_reached = element.value
-                        self.__update_remaining_duration()
-                        LOG.debug('Charging estimated date reached Changed: %s', self.estimated_date_reached.isoformat())
+                        self.pending_estimated_date_reached = element.value
+                        LOG.debug('Charging estimated date reached Changed: %s', element.value)
                     else:
-                        self.estimated_date_reached = None
-                        self.char_remaining_duration.set_value(0)
+                        self.pending_estimated_date_reached = None
                         LOG.debug('Charging estimated date reached Changed: None')
+                    # Bursts of measurements are coalesced into a single update of the remaining duration
+                    if not self.estimated_date_reached_update_scheduled:
+                        self.estimated_date_reached_update_scheduled = True
+                        self.driver.loop.call_soon_threadsafe(self.driver.loop.call_later, 0.25, self.__apply_estimated_date_reached)
             else:
                 LOG.debug('Unsupported event %s', flags)
 
+    def __apply_estimated_date_reached(self) -> None:
+        """Take over the last estimated date reached and update the remaining duration. Runs on the event loop of the driver."""
+        with self.cc_date_reached_lock:
+            self.estimated_date_reached = self.pending_estimated_date_reached
+            self.estimated_date_reached_update_scheduled = False
+        # Translate the date into a monotonic deadline once, so the periodic update does not need any datetime arithmetic
+        if self.estimated_date_reached is not None:
+            self.remaining_duration_deadline = time.monotonic() + (self.estimated_date_reached - datetime.now(tz=timezone.utc)).total_seconds()
+        else:
+            self.remaining_duration_deadline = None
+        self.__update_remaining_duration()
+
     # pylint: disable=duplicate-code
     def __update_remaining_duration(self) -> None:
+        """Update the remaining duration and reschedule itself every 5 seconds while charging. Runs on the event loop of the driver."""
         if self.update_remaining_duration_timer is not None:
             self.update_remaining_duration_timer.cancel()
             self.update_remaining_duration_timer = None
         if self.char_remaining_duration is not None:
             remaining_duration: int = 0
-            utc_now: datetime = datetime.now(tz=timezone.utc)
-            if self.estimated_date_reached is not None and self.estimated_date_reached > utc_now:
-                remaining_duration = round((self.estimated_date_reached - utc_now).total_seconds())
-            self.char_remaining_duration.set_value(remaining_duration)
+            if self.remaining_duration_deadline is not None:
+                remaining_duration = max(0, round(self.remaining_duration_deadline - time.monotonic()))
+            self._set_if_changed(self.char_remaining_duration, remaining_duration)
             if remaining_duration > 0 and not self.driver.stop_event.is_set():
-                self.update_remaining_duration_timer = threading.Timer(interval=5.0, function=self.__update_remaining_duration)
-                self.update_remaining_duration_timer.start()
+                self.update_remaining_duration_timer = self.driver.loop.call_later(5.0, self.__update_remaining_duration)
     # pylint: enable=duplicate-code
 
     def __on_cc_power_change(self, element: Any, flags: Observable.ObserverEvent) -> None:
@@ -183,10 +217,11 @@ class ChargingAccessory(BatteryGenericVehicleAccessory):  # pylint: disable=too-
             if flags & Observable.ObserverEvent.VALUE_CHANGED:
                 if self.char_consumption is not None:
                     if isinstance(element, PowerAttribute) and element.value is not None:
-                        self.char_consumption.set_value(element.power_in(unit=Power.W))
-                        LOG.debug('Charging power Changed: %dW', element.power_in(unit=Power.W))
+                        power: Optional[float] = element.power_in(unit=Power.W)
+                        self._set_if_changed(self.char_consumption, power)
+                        LOG.debug('Charging power Changed: %dW', power)
                     else:
-                        self.char_consumption.set_value(0)
+                        self._set_if_changed(self.char_consumption, 0)
             else:
                 LOG.debug('Unsupported event %s', flags)
 
@@ -194,16 +229,7 @@ class ChargingAccessory(BatteryGenericVehicleAccessory):  # pylint: disable=too-
         with self.cc_connector_state_lock:
             if flags & Observable.ObserverEvent.VALUE_CHANGED:
                 if self.char_outlet_in_use is not None:
-                    if element.value is None:
-                        self.char_outlet_in_use.set_value(False)
-                    elif element.value == ChargingConnector.ChargingConnectorConnectionState.CONNECTED:
-                        self.char_outlet_in_use.set_value(True)
-                    elif element.value in (ChargingConnector.ChargingConnectorConnectionState.DISCONNECTED,
-                                           ChargingConnector.ChargingConnectorConnectionState.INVALID,
-                                           ChargingConnector.ChargingConnectorConnectionState.UNSUPPORTED):
-                        self.char_outlet_in_use.set_value(False)
-                    else:
-                        self.char_outlet_in_use.set_value(False)
-                        LOG.warning('unsupported charging connector state: %s', element.value.value)
+                    self._set_mapped_value(self.char_outlet_in_use, element.value, _CONNECTOR_STATE_TO_OUTLET_IN_USE, default=False, logger=LOG,
+                                           description='charging connector state')
             else:
                 LOG.debug('Unsupported event %s', flags)
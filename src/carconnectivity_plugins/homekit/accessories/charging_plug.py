@@ -16,7 +16,7 @@ from carconnectivity.vehicle import ElectricVehicle
 from carconnectivity_plugins.homekit.accessories.generic_accessory import GenericAccessory
 
 if TYPE_CHECKING:
-    from typing import Optional, Any
+    from typing import Optional, Any, Dict, Tuple
 
     from pyhap.service import Service
     from pyhap.accessory_driver import AccessoryDriver
@@ -28,6 +28,13 @@ if TYPE_CHECKING:
 
 LOG: logging.Logger = logging.getLogger("carconnectivity.plugins.homekit.charging_plug")
 
+# Values of the ContactSensorState and StatusFault characteristics for the connection states, other states are reported as fault
+_CONNECTION_STATE_TO_CONTACT_AND_FAULT: Dict[ChargingConnector.ChargingConnectorConnectionState, Tuple[int, int]] = {
+    ChargingConnector.ChargingConnectorConnectionState.CONNECTED: (0, 0),
+    ChargingConnector.ChargingConnectorConnectionState.DISCONNECTED: (1, 0),
+    ChargingConnector.ChargingConnectorConnectionState.UNSUPPORTED: (1, 0),
+}
+
 
 class ChargingPlugAccessory(GenericAccessory):
     """Charging Plug Accessory"""
@@ -53,7 +60,8 @@ class ChargingPlugAccessory(GenericAccessory):
         if self.vehicle is not None and isinstance(self.vehicle, ElectricVehicle) and self.vehicle.charging is not None \
                 and self.vehicle.charging.connector is not None:
             if self.vehicle.charging.connector.connection_state is not None:
-                self.vehicle.charging.connector.connection_state.add_observer(self.__on_cc_connection_state_change, flag=Observable.ObserverEvent.VALUE_CHANGED)
+                self._add_cc_observer(self.vehicle.charging.connector.connection_state, self.__on_cc_connection_state_change,
+                                      flag=Observable.ObserverEvent.VALUE_CHANGED)
                 self.char_contact_sensor_state = self.service.configure_char('ContactSensorState')
                 if self.vehicle.charging.connector.connection_state.enabled:
                     self.__on_cc_connection_state_change(self.vehicle.charging.connector.connection_state, Observable.ObserverEvent.VALUE_CHANGED)
@@ -65,22 +73,13 @@ class ChargingPlugAccessory(GenericAccessory):
             if flags & Observable.ObserverEvent.VALUE_CHANGED:
                 if self.char_contact_sensor_state is not None:
                     if element.value is None:
-                        self.char_contact_sensor_state.set_value(0)
-                        if self.char_status_fault is not None:
-                            self.char_status_fault.set_value(0)
-                    if isinstance(element.value, ChargingConnector.ChargingConnectorConnectionState):
-                        if element.value == ChargingConnector.ChargingConnectorConnectionState.CONNECTED:
-                            self.char_contact_sensor_state.set_value(0)
-                            if self.char_status_fault is not None:
-                                self.char_status_fault.set_value(0)
-                        elif element.value in [ChargingConnector.ChargingConnectorConnectionState.DISCONNECTED,
-                                               ChargingConnector.ChargingConnectorConnectionState.UNSUPPORTED]:
-                            self.char_contact_sensor_state.set_value(1)
-                            if self.char_status_fault is not None:
-                                self.char_status_fault.set_value(0)
-                        else:
-                            self.char_contact_sensor_state.set_value(1)
-                            if self.char_status_fault is not None:
-                                self.char_status_fault.set_value(1)
-                else:
-                    LOG.debug('Unsupported event %s', flags)
+                        contact_state, status_fault = 0, 0
+                    elif isinstance(element.value, ChargingConnector.ChargingConnectorConnectionState):
+                        contact_state, status_fault = _CONNECTION_STATE_TO_CONTACT_AND_FAULT.get(element.value, (1, 1))
+                    else:
+                        return
+                    self._set_if_changed(self.char_contact_sensor_state, contact_state)
+                    if self.char_status_fault is not None:
+                        self._set_if_changed(self.char_status_fault, status_fault)
+            else:
+                LOG.debug('Unsupported event %s', flags)
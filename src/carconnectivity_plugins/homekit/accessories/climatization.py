@@ -22,7 +22,9 @@ from carconnectivity_plugins.homekit.accessories.generic_accessory import Batter
 from carconnectivity_plugins.homekit.accessories.util import TEMPERATURE_UNIT_TO_VALUE, VALUE_TO_TEMPERATURE_UNIT
 
 if TYPE_CHECKING:
-    from typing import Optional, Any, Dict
+    from typing import Optional, Any, Dict, Tuple
+
+    import asyncio
 
     from pyhap.service import Service
     from pyhap.accessory_driver import AccessoryDriver
@@ -33,6 +35,20 @@ if TYPE_CHECKING:
 
 LOG: logging.Logger = logging.getLogger("carconnectivity.plugins.homekit.climatization")
 
+# Values of the CurrentHeatingCoolingState and TargetHeatingCoolingState characteristics for the supported climatization states
+_CLIMATIZATION_STATE_TO_HEATING_COOLING_STATES: Dict[Climatization.ClimatizationState, Tuple[int, int]] = {
+    Climatization.ClimatizationState.HEATING: (1, 3),
+    Climatization.ClimatizationState.COOLING: (2, 3),
+    Climatization.ClimatizationState.VENTILATION: (2, 3),
+    Climatization.ClimatizationState.OFF: (0, 0),
+}
+
+# Default (minValue, maxValue) of the TargetTemperature characteristic per display unit
+_DEFAULT_TARGET_TEMPERATURE_RANGES: Dict[Temperature, Tuple[float, float]] = {
+    Temperature.C: (16, 29.5),
+    Temperature.F: (61, 85),
+}
+
 
 class ClimatizationAccessory(BatteryGenericVehicleAccessory):  # pylint: disable=too-many-instance-attributes
     """Climatization Accessory"""
@@ -45,7 +61,8 @@ class ClimatizationAccessory(BatteryGenericVehicleAccessory):  # pylint: disable
                  vehicle: GenericVehicle) -> None:
         super().__init__(driver=driver, bridge=bridge, display_name=display_name, aid=aid, vin=vin, id_str=id_str, vehicle=vehicle)
 
-        self.update_remaining_duration_timer: Optional[threading.Timer] = None
+        # Handle of the periodic remaining duration update, scheduled on the event loop of the driver
+        self.update_remaining_duration_timer: Optional[asyncio.TimerHandle] = None
 
         # pyright: ignore[reportArgumentType]
         self.service: Optional[Service] = self.add_preload_service(service='Thermostat',  # pyright: ignore[reportArgumentType]
@@ -62,8 +79,8 @@ class ClimatizationAccessory(BatteryGenericVehicleAccessory):  # pylint: disable
         self.estimated_date_reached: Optional[datetime] = None
 
         self.cc_car_type_lock: threading.Lock = threading.Lock()
+        self.soc_characteristic_added: bool = False
         self.cc_climatization_state_lock: threading.Lock = threading.Lock()
-        self.cc_estimated_date_reached_lock: threading.Lock = threading.Lock()
         self.cc_target_temperature_lock: threading.Lock = threading.Lock()
 
         self.target_temperature_attribute: Optional[TemperatureAttribute] = None
@@ -82,14 +99,12 @@ class ClimatizationAccessory(BatteryGenericVehicleAccessory):  # pylint: disable
         if self.vehicle is not None and self.vehicle.climatization is not None \
                 and (target_temperature_attribute := self.vehicle.climatization.settings.target_temperature) is not None:
             self.target_temperature_attribute = target_temperature_attribute
-            target_temperature_attribute.add_observer(self.__on_cc_target_temperature_change, flag=Observable.ObserverEvent.VALUE_CHANGED)
+            self._add_cc_observer(target_temperature_attribute, self.__on_cc_target_temperature_change, flag=Observable.ObserverEvent.VALUE_CHANGED)
             if target_temperature_attribute.enabled:
                 self.current_target_temperature = target_temperature_attribute.temperature_in(unit=self.configured_temperature_unit)
             if self.current_target_temperature is None:
-                if self.configured_temperature_unit == Temperature.C:
-                    self.current_target_temperature = 16
-                elif self.configured_temperature_unit == Temperature.F:
-                    self.current_target_temperature = 61
+                if self.configured_temperature_unit in _DEFAULT_TARGET_TEMPERATURE_RANGES:
+                    self.current_target_temperature = _DEFAULT_TARGET_TEMPERATURE_RANGES[self.configured_temperature_unit][0]
                 else:
                     LOG.error('Invalid temperature unit: %s', self.configured_temperature_unit)
             self.char_target_temperature = self.service.configure_char('TargetTemperature', value=self.current_target_temperature,
@@ -98,12 +113,9 @@ class ClimatizationAccessory(BatteryGenericVehicleAccessory):  # pylint: disable
 
         if self.vehicle is not None and self.vehicle.climatization is not None:
             if self.vehicle.climatization.state is not None:
-                self.vehicle.climatization.state.add_observer(self.__on_cc_climatization_state_change, flag=Observable.ObserverEvent.VALUE_CHANGED)
+                self._add_cc_observer(self.vehicle.climatization.state, self.__on_cc_climatization_state_change,
+                                      flag=Observable.ObserverEvent.VALUE_CHANGED)
                 self.char_current_heating_cooling_state = self.service.configure_char('CurrentHeatingCoolingState')
-                if self.vehicle.climatization.state.enabled:
-                    self.__on_cc_climatization_state_change(self.vehicle.climatization.state, Observable.ObserverEvent.VALUE_CHANGED)
-                else:
-                    self.__on_cc_climatization_state_change(Climatization.ClimatizationState.UNKNOWN, Observable.ObserverEvent.VALUE_CHANGED)
 
             if self.vehicle.climatization.commands is not None and self.vehicle.climatization.commands.contains_command('start-stop'):
                 self.climatization_start_stop_command = self.vehicle.climatization.commands.commands['start-stop']
@@ -111,12 +123,17 @@ class ClimatizationAccessory(BatteryGenericVehicleAccessory):  # pylint: disable
                                                                                      valid_values={'Auto': 3, 'Off': 0},
                                                                                      setter_callback=self.__on_hk_target_heating_cooling_state_changed)
                 self.char_target_heating_cooling_state.allow_invalid_client_values = True
-                # call on change again to also set the target state
-                self.__on_cc_climatization_state_change(self.vehicle.climatization.state, Observable.ObserverEvent.VALUE_CHANGED)
+
+            # sets the current and the target state at once
+            if self.vehicle.climatization.state is not None:
+                if self.vehicle.climatization.state.enabled:
+                    self.__on_cc_climatization_state_change(self.vehicle.climatization.state, Observable.ObserverEvent.VALUE_CHANGED)
+                else:
+                    self.__on_cc_climatization_state_change(Climatization.ClimatizationState.UNKNOWN, Observable.ObserverEvent.VALUE_CHANGED)
 
             if self.vehicle.climatization.estimated_date_reached is not None:
-                self.vehicle.climatization.estimated_date_reached.add_observer(self.__on_cc_estimated_date_reached_change,
-                                                                               flag=Observable.ObserverEvent.UPDATED_NEW_MEASUREMENT)
+                self._add_cc_observer(self.vehicle.climatization.estimated_date_reached, self.__on_cc_estimated_date_reached_change,
+                                      flag=Observable.ObserverEvent.UPDATED_NEW_MEASUREMENT)
                 self.char_remaining_duration = self.service.configure_char('RemainingDuration')
                 if self.vehicle.climatization.estimated_date_reached.enabled:
                     self.__on_cc_estimated_date_reached_change(self.vehicle.climatization.estimated_date_reached,
@@ -128,27 +145,40 @@ class ClimatizationAccessory(BatteryGenericVehicleAccessory):  # pylint: disable
         if self.battery_service is None and isinstance(self.vehicle, ElectricVehicle):
             self.add_soc_characteristic()
         else:
-            self.vehicle.add_observer(self.__on_cc_car_type_change, flag=Observable.ObserverEvent.UPDATED)
+            self._add_cc_observer(self.vehicle, self.__on_cc_car_type_change, flag=Observable.ObserverEvent.UPDATED)
     # pylint: disable=duplicate-code
 
+    async def stop(self) -> None:
+        """Stops the accessory and cancels the periodic remaining duration update."""
+        await super().stop()
+        if self.update_remaining_duration_timer is not None:
+            self.update_remaining_duration_timer.cancel()
+            self.update_remaining_duration_timer = None
+
     def __on_cc_car_type_change(self, element: Any, flags: Observable.ObserverEvent) -> None:
-        with self.cc_car_type_lock:
-            if flags & Observable.ObserverEvent.UPDATED:
-                if isinstance(element, ElectricVehicle):
-                    self.add_soc_characteristic()
-                    self.vehicle.type.remove_observer(self.__on_cc_car_type_change)
-            else:
-                LOG.debug('Unsupported event %s', flags)
+        # The observer stays registered (carconnectivity's remove_observer drops all other observers), so it is only disabled
+        if self.soc_characteristic_added:
+            return
+        if flags & Observable.ObserverEvent.UPDATED:
+            # UPDATED events of all children of the vehicle reach this observer as well, only the vehicle itself is of interest
+            if isinstance(element, ElectricVehicle):
+                with self.cc_car_type_lock:
+                    if self.battery_service is None:
+                        self.add_soc_characteristic()
+                    # The level of the electric drive may not be available yet, then the next update tries again
+                    self.soc_characteristic_added = self.battery_service is not None
+        else:
+            LOG.debug('Unsupported event %s', flags)
 
     def __on_cc_target_temperature_change(self, element: Any, flags: Observable.ObserverEvent) -> None:
         with self.cc_target_temperature_lock:
             if flags & Observable.ObserverEvent.VALUE_CHANGED and isinstance(element, TemperatureAttribute):
-                target_temperature_unit: Temperature = Temperature.C
-                if self.char_temperature_display_units is not None:
-                    target_temperature_unit = VALUE_TO_TEMPERATURE_UNIT[self.char_temperature_display_units.get_value()]
+                # configured_temperature_unit follows the TemperatureDisplayUnits characteristic
+                target_temperature_unit: Temperature = self.configured_temperature_unit or Temperature.C
+                target_temperature: Optional[float] = element.temperature_in(unit=target_temperature_unit)
                 if self.char_target_temperature is not None and element.enabled and element.value is not None:
-                    self.char_target_temperature.set_value(element.temperature_in(unit=target_temperature_unit))
-                LOG.info('targetTemperature Changed: %f', element.temperature_in(unit=target_temperature_unit))
+                    self._set_if_changed(self.char_target_temperature, target_temperature)
+                LOG.info('targetTemperature Changed: %s', target_temperature)
             else:
                 LOG.debug('Unsupported event %s', flags)
 
@@ -172,14 +202,10 @@ class ClimatizationAccessory(BatteryGenericVehicleAccessory):  # pylint: disable
             if self.climatization_start_stop_command is not None and self.climatization_start_stop_command.enabled:
                 if value in (1, 2, 3):
                     LOG.info('Switch climatization on')
-                    command_args: Dict[str, Any] = {}
-                    command_args['command'] = ClimatizationStartStopCommand.Command.START
-                    self.climatization_start_stop_command.value = command_args
+                    self.climatization_start_stop_command.value = {'command': ClimatizationStartStopCommand.Command.START}
                 elif value == 0:
                     LOG.info('Switch climatization off')
-                    command_args: Dict[str, Any] = {}
-                    command_args['command'] = ClimatizationStartStopCommand.Command.STOP
-                    self.climatization_start_stop_command.value = command_args
+                    self.climatization_start_stop_command.value = {'command': ClimatizationStartStopCommand.Command.STOP}
                 else:
                     LOG.error('Input for climatization not understood: %d', value)
         except SetterError as setter_error:
@@ -195,7 +221,8 @@ class ClimatizationAccessory(BatteryGenericVehicleAccessory):  # pylint: disable
         if value in VALUE_TO_TEMPERATURE_UNIT:
             if self.char_temperature_display_units is not None:
                 self.char_temperature_display_units.set_value(value)
-            self.bridge.set_config_item(self.id_str, self.vin, 'TemperatureDisplayUnits', value)
+            if self.bridge.set_config_item(self.id_str, self.vin, 'TemperatureDisplayUnits', value):
+                self.bridge.persist_config()
             self.configured_temperature_unit = VALUE_TO_TEMPERATURE_UNIT[value]
             self.__update_display_units_properties()
             self.__on_cc_target_temperature_change(element=self.target_temperature_attribute, flags=Observable.ObserverEvent.VALUE_CHANGED)
@@ -204,82 +231,67 @@ class ClimatizationAccessory(BatteryGenericVehicleAccessory):  # pylint: disable
 
     def __update_display_units_properties(self) -> None:
         if self.char_target_temperature is not None and self.char_temperature_display_units is not None:
+            default_range: Optional[Tuple[float, float]] = _DEFAULT_TARGET_TEMPERATURE_RANGES.get(self.configured_temperature_unit)
+            if default_range is None:
+                return
+            min_value, max_value = default_range
             min_step: float = 0.5
-            if self.target_temperature_attribute is not None and self.target_temperature_attribute.precision is not None:
-                min_step = self.target_temperature_attribute.precision
-            if self.configured_temperature_unit == Temperature.C:
-                max_value: float = 29.5
-                if self.target_temperature_attribute is not None and self.target_temperature_attribute.maximum is not None:
-                    max_value = self.target_temperature_attribute.maximum
-                min_value: float = 16
-                if self.target_temperature_attribute is not None and self.target_temperature_attribute.minimum is not None:
-                    min_value = self.target_temperature_attribute.minimum
-                self.char_target_temperature.override_properties(properties={'maxValue': max_value, 'minStep': min_step, 'minValue': min_value})
-            elif self.configured_temperature_unit == Temperature.F:
-                max_value: float = 85
-                if self.target_temperature_attribute is not None and self.target_temperature_attribute.maximum is not None:
-                    max_value = self.target_temperature_attribute.maximum
-                min_value: float = 61
-                if self.target_temperature_attribute is not None and self.target_temperature_attribute.minimum is not None:
-                    min_value = self.target_temperature_attribute.minimum
-                self.char_target_temperature.override_properties(properties={'maxValue': 85, 'minStep': min_step, 'minValue': 61})
-
-    def __on_cc_climatization_state_change(self, element: Any, flags: Observable.ObserverEvent) -> None:  # pylint: disable=too-many-branches
+            attribute: Optional[TemperatureAttribute] = self.target_temperature_attribute
+            if attribute is not None:
+                if attribute.precision is not None:
+                    min_step = attribute.precision
+                # Limits reported in another or an unknown unit than the display unit would need converting, keep the defaults then
+                if attribute.unit == self.configured_temperature_unit:
+                    if attribute.minimum is not None:
+                        min_value = attribute.minimum
+                    if attribute.maximum is not None:
+                        max_value = attribute.maximum
+            self.char_target_temperature.override_properties(properties={'maxValue': max_value, 'minStep': min_step, 'minValue': min_value})
+
+    def __on_cc_climatization_state_change(self, element: Any, flags: Observable.ObserverEvent) -> None:
         with self.cc_climatization_state_lock:
             if flags & Observable.ObserverEvent.VALUE_CHANGED:
                 if self.char_current_heating_cooling_state is not None:
-                    if element.value is None:
-                        self.char_current_heating_cooling_state.set_value(0)
-                        if self.char_target_heating_cooling_state is not None:
-                            self.char_target_heating_cooling_state.set_value(0)
-                    elif element.value == Climatization.ClimatizationState.HEATING:
-                        self.char_current_heating_cooling_state.set_value(1)
-                        if self.char_target_heating_cooling_state is not None:
-                            self.char_target_heating_cooling_state.set_value(3)
-                    elif element.value in (Climatization.ClimatizationState.COOLING, Climatization.ClimatizationState.VENTILATION):
-                        self.char_current_heating_cooling_state.set_value(2)
-                        if self.char_target_heating_cooling_state is not None:
-                            self.char_target_heating_cooling_state.set_value(3)
-                    elif element.value == Climatization.ClimatizationState.OFF:
-                        self.char_current_heating_cooling_state.set_value(0)
-                        if self.char_target_heating_cooling_state is not None:
-                            self.char_target_heating_cooling_state.set_value(0)
-                    else:
-                        self.char_current_heating_cooling_state.set_value(0)
-                        if self.char_target_heating_cooling_state is not None:
-                            self.char_target_heating_cooling_state.set_value(0)
-                        LOG.warning('unsupported climatisationState: %s', element.value.value)
-                    LOG.debug('Climatization State Changed: %s', element.value.value)
-                else:
-                    LOG.debug('Unsupported event %s', flags)
-
-    def __on_cc_estimated_date_reached_change(self, element: Any, flags: Observable.ObserverEvent) -> None:
-        with self.cc_estimated_date_reached_lock:
-            if flags & Observable.ObserverEvent.UPDATED_NEW_MEASUREMENT:
-                if self.char_remaining_duration is not None:
-                    if element.enabled and element.value is not None and isinstance(element.value, datetime):
-                        self.estimated_date_reached = element.value
-                        self.__update_remaining_duration()
-                        LOG.debug('Climatization estimated date reached Changed: %s', self.estimated_date_reached.isoformat())
-                    else:
-                        self.estimated_date_reached = None
-                        self.char_remaining_duration.set_value(0)
-                        LOG.debug('Climatization estimated date reached Changed: None')
+                    states: Optional[Tuple[int, int]] = _CLIMATIZATION_STATE_TO_HEATING_COOLING_STATES.get(element.value)
+                    if states is None:
+                        states = (0, 0)
+                        if element.value is not None:
+                            LOG.warning('unsupported climatisationState: %s', getattr(element.value, 'value', element.value))
+                    current_state, target_state = states
+                    self._set_if_changed(self.char_current_heating_cooling_state, current_state)
+                    if self.char_target_heating_cooling_state is not None:
+                        self._set_if_changed(self.char_target_heating_cooling_state, target_state)
+                    LOG.debug('Climatization State Changed: %s', getattr(element.value, 'value', element.value))
             else:
                 LOG.debug('Unsupported event %s', flags)
 
+    def __on_cc_estimated_date_reached_change(self, element: Any, flags: Observable.ObserverEvent) -> None:
+        if flags & Observable.ObserverEvent.UPDATED_NEW_MEASUREMENT:
+            if self.char_remaining_duration is not None:
+                if element.enabled and element.value is not None and isinstance(element.value, datetime):
+                    self.estimated_date_reached = element.value
+                    self.driver.loop.call_soon_threadsafe(self.__update_remaining_duration)
+                    LOG.debug('Climatization estimated date reached Changed: %s', self.estimated_date_reached)
+                else:
+                    self.estimated_date_reached = None
+                    self._set_if_changed(self.char_remaining_duration, 0)
+                    LOG.debug('Climatization estimated date reached Changed: None')
+        else:
+            LOG.debug('Unsupported event %s', flags)
+
     # pylint: disable=duplicate-code
     def __update_remaining_duration(self) -> None:
+        """Update the remaining duration and reschedule itself every 5 seconds while climatizing. Runs on the event loop of the driver."""
         if self.update_remaining_duration_timer is not None:
             self.update_remaining_duration_timer.cancel()
             self.update_remaining_duration_timer = None
         if self.char_remaining_duration is not None:
             remaining_duration: int = 0
-            utc_now: datetime = datetime.now(tz=timezone.utc)
-            if self.estimated_date_reached is not None and self.estimated_date_reached > utc_now:
-                remaining_duration = round((self.estimated_date_reached - utc_now).total_seconds())
-            self.char_remaining_duration.set_value(remaining_duration)
+            if self.estimated_date_reached is not None:
+                utc_now: datetime = datetime.now(tz=timezone.utc)
+                if self.estimated_date_reached > utc_now:
+                    remaining_duration = round((self.estimated_date_reached - utc_now).total_seconds())
+            self._set_if_changed(self.char_remaining_duration, remaining_duration)
             if remaining_duration > 0 and not self.driver.stop_event.is_set():
-                self.update_remaining_duration_timer = threading.Timer(interval=5.0, function=self.__update_remaining_duration)
-                self.update_remaining_duration_timer.start()
+                self.update_remaining_duration_timer = self.driver.loop.call_later(5.0, self.__update_remaining_duration)
     # pylint: enable=duplicate-code
@@ -3,7 +3,6 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import logging
-from threading import Timer
 
 from pyhap.characteristic import Characteristic
 from pyhap.const import CATEGORY_LIGHTBULB
@@ -15,7 +14,9 @@ from carconnectivity.command_impl import HonkAndFlashCommand
 from carconnectivity_plugins.homekit.accessories.generic_accessory import GenericAccessory
 
 if TYPE_CHECKING:
-    from typing import Optional, Any, Dict
+    from typing import Optional, Any
+
+    import asyncio
 
     from pyhap.service import Service
     from pyhap.accessory_driver import AccessoryDriver
@@ -44,6 +45,7 @@ class FlashingLightAccessory(GenericAccessory):
                                                                           'On', 'StatusFault'])
 
         self.char_on: Optional[Characteristic] = None
+        self.reset_state_timer: Optional[asyncio.TimerHandle] = None
 
         self.add_name_characteristics()
         self.add_status_fault_characteristic()
@@ -53,21 +55,31 @@ class FlashingLightAccessory(GenericAccessory):
             self.honk_flash_command: GenericCommand = self.vehicle.commands.commands['honk-flash']
             self.char_on = self.service.configure_char('On', setter_callback=self.__on_hk_on_change)
 
+    async def stop(self) -> None:
+        """Stops the accessory and cancels a pending reset of the On characteristic."""
+        await super().stop()
+        if self.reset_state_timer is not None:
+            self.reset_state_timer.cancel()
+            self.reset_state_timer = None
+
+    def __schedule_reset_state(self) -> None:
+        # Runs on the driver loop, a reset still pending from an earlier flash is replaced
+        if self.reset_state_timer is not None:
+            self.reset_state_timer.cancel()
+        self.reset_state_timer = self.driver.loop.call_later(10.0, self.__reset_state)
+
+    def __reset_state(self) -> None:
+        self.reset_state_timer = None
+        if self.char_on is not None:
+            self.char_on.set_value(False)
+
     def __on_hk_on_change(self, value: Any) -> None:
         try:
             if self.honk_flash_command is not None and self.honk_flash_command.enabled:
                 if value is True:
                     LOG.info('Start flashing for 10 seconds')
-                    command_args: Dict[str, Any] = {}
-                    command_args['command'] = HonkAndFlashCommand.Command.FLASH
-                    self.honk_flash_command.value = command_args
-
-                    def reset_state():
-                        if self.char_on is not None:
-                            self.char_on.set_value(False)
-
-                    timer = Timer(10.0, reset_state)
-                    timer.start()
+                    self.honk_flash_command.value = {'command': HonkAndFlashCommand.Command.FLASH}
+                    self.driver.loop.call_soon_threadsafe(self.__schedule_reset_state)
                 else:
                     LOG.error('Flashing cannot be turned off, please wait for flashing to stop')
         except SetterError as setter_error:
@@ -4,6 +4,8 @@ from typing import TYPE_CHECKING
 
 import logging
 import threading
+import weakref
+from functools import lru_cache
 
 from pyhap.accessory import Accessory
 from pyhap.characteristic import Characteristic
@@ -13,7 +15,9 @@ from carconnectivity.vehicle import ElectricVehicle
 from carconnectivity.charging import Charging
 
 if TYPE_CHECKING:
-    from typing import Optional, Any
+    from typing import Optional, Any, Callable, Dict, Mapping
+
+    import asyncio
 
     from pyhap.accessory_driver import AccessoryDriver
     from pyhap.service import Service
@@ -24,6 +28,25 @@ if TYPE_CHECKING:
 
 LOG: logging.Logger = logging.getLogger("carconnectivity.plugins.homekit.generic_accessory")
 
+_VALUE_CHANGED: Observable.ObserverEvent = Observable.ObserverEvent.VALUE_CHANGED
+
+# Values of the ChargingState characteristic of the BatteryService: 0 not charging, 1 charging, 2 not chargeable
+_CHARGING_STATE_TO_BATTERY_CHARGING_STATE: Dict[Charging.ChargingState, int] = {
+    Charging.ChargingState.OFF: 0,
+    Charging.ChargingState.READY_FOR_CHARGING: 0,
+    Charging.ChargingState.UNSUPPORTED: 0,
+    Charging.ChargingState.CHARGING: 1,
+    Charging.ChargingState.DISCHARGING: 1,
+    Charging.ChargingState.CONSERVATION: 1,
+    Charging.ChargingState.ERROR: 2,
+}
+
+
+@lru_cache(maxsize=128)
+def _warn_unsupported(logger: logging.Logger, description: str, value: Any) -> None:
+    """Logs a warning about an unsupported value. Being cached, the warning is only logged once per logger, description and value."""
+    logger.warning('unsupported %s: %s', description, getattr(value, 'value', value))
+
 
 class GenericAccessory(Accessory):  # pylint: disable=too-many-instance-attributes
     """
@@ -52,11 +75,90 @@ class GenericAccessory(Accessory):  # pylint: disable=too-many-instance-attribut
         self.service: Optional[Service] = None
 
         self.char_status_fault: Optional[Characteristic] = None
-        self.__char_status_fault_timer: Optional[threading.Timer] = None
+        self.__char_status_fault_timer: Optional[asyncio.TimerHandle] = None
 
         self.char_configured_name: Optional[Characteristic] = None
         self.char_name: Optional[Characteristic] = None
 
+        self._stopped: bool = False
+
+    def _add_cc_observer(self, observable: Observable, observer: Callable[[Any, Observable.ObserverEvent], None],
+                         flag: Observable.ObserverEvent) -> None:
+        """
+        Adds a bound method of the accessory as observer to a CarConnectivity object.
+
+        The observer is not removed on stop, as `Observable.remove_observer` of carconnectivity keeps only the matching observer
+        and drops all others, including those of carconnectivity itself and of other plugins. Instead, the registered callback only
+        holds a weak reference to the method, so the CarConnectivity object does not keep the accessory alive, and it does nothing
+        once the accessory is stopped or deleted.
+
+        Args:
+            observable (Observable): The CarConnectivity object to observe.
+            observer (Callable[[Any, Observable.ObserverEvent], None]): The bound method to register.
+            flag (Observable.ObserverEvent): The events the observer is interested in.
+        """
+        ref: weakref.WeakMethod = weakref.WeakMethod(observer)  # type: ignore[arg-type]
+
+        def weak_observer(element: Any, flags: Observable.ObserverEvent) -> None:
+            method = ref()
+            if method is None or method.__self__._stopped:  # pylint: disable=protected-access
+                return
+            method(element, flags)
+        observable.add_observer(weak_observer, flag=flag)
+
+    async def stop(self) -> None:
+        """
+        Stops the accessory.
+
+        Observers registered with `_add_cc_observer` stay registered but are no longer called.
+        """
+        await super().stop()
+        self._stopped = True
+        if self.__char_status_fault_timer is not None:
+            self.__char_status_fault_timer.cancel()
+            self.__char_status_fault_timer = None
+
+    @staticmethod
+    def _set_if_changed(char: Characteristic, value: Any) -> None:
+        """
+        Sets the value of a characteristic only if it differs from the current value.
+
+        This avoids validating and dispatching values that HomeKit already knows.
+
+        Args:
+            char (Characteristic): The characteristic to set.
+            value (Any): The new value.
+        """
+        if char.value != value:
+            char.set_value(value)
+
+    # pylint: disable-next=too-many-arguments,too-many-positional-arguments
+    def _set_mapped_value(self, char: Characteristic, value: Any, mapping: Mapping[Any, Any], default: Any, logger: logging.Logger,
+                          description: str) -> None:
+        """
+        Sets a characteristic to the HomeKit value that `mapping` holds for a CarConnectivity value.
+
+        If `value` is None, the characteristic is set to `default`. If `value` is not contained in `mapping`, the characteristic is
+        set to `default` as well and a warning is logged once per value.
+
+        Args:
+            char (Characteristic): The characteristic to set.
+            value (Any): The CarConnectivity value, usually an enum member.
+            mapping (Mapping[Any, Any]): Maps CarConnectivity values to HomeKit values.
+            default (Any): The HomeKit value to use for None or unsupported values.
+            logger (logging.Logger): The logger to report unsupported values to.
+            description (str): Name of the value used in the warning.
+        """
+        if value is None:
+            self._set_if_changed(char, default)
+            return
+        mapped_value: Any = mapping.get(value)
+        if mapped_value is None:
+            self._set_if_changed(char, default)
+            _warn_unsupported(logger, description, value)
+            return
+        self._set_if_changed(char, mapped_value)
+
     def add_name_characteristics(self) -> None:
         """
         Adds name characteristics to the accessory's service.
@@ -87,8 +189,8 @@ class GenericAccessory(Accessory):  # pylint: disable=too-many-instance-attribut
             value (Any): The new configured name value.
         """
         if value is not None and len(value) > 0:
-            self.bridge.set_config_item(id_str=self.id_str, vin=self.vin, config_key='ConfiguredName', item=value)
-            self.bridge.persist_config()
+            if self.bridge.set_config_item(id_str=self.id_str, vin=self.vin, config_key='ConfiguredName', item=value):
+                self.bridge.persist_config()
             if self.char_configured_name is not None:
                 self.char_configured_name.set_value(value)
             if self.char_name is not None:
@@ -123,18 +225,28 @@ class GenericAccessory(Accessory):  # pylint: disable=too-many-instance-attribut
             None
         """
         if self.char_status_fault is not None:
-            if self.__char_status_fault_timer is not None and self.__char_status_fault_timer.is_alive():
-                self.__char_status_fault_timer.cancel()
-                self.__char_status_fault_timer = None
-            if timeout == 0:
-                self.char_status_fault.set_value(value)
-            else:
-                if timeout_value is None:
-                    timeout_value = self.char_status_fault.get_value()
-                self.char_status_fault.set_value(value)
-                self.__char_status_fault_timer = threading.Timer(timeout, self.__reset_status_fault, [timeout_value])
-                self.__char_status_fault_timer.daemon = True
-                self.__char_status_fault_timer.start()
+            if timeout != 0 and timeout_value is None:
+                timeout_value = self.char_status_fault.get_value()
+            self.char_status_fault.set_value(value)
+            # The reset is scheduled on the driver loop, so pending resets are replaced in call order
+            self.driver.loop.call_soon_threadsafe(self.__schedule_status_fault_reset, timeout, timeout_value)
+
+    def __schedule_status_fault_reset(self, timeout: float, timeout_value: Optional[int]) -> None:
+        """
+        Replaces a pending reset of the status fault characteristic. Runs on the event loop of the driver.
+
+        Args:
+            timeout (float): The time in seconds after which the status fault should be reset. 0 only cancels a pending reset.
+            timeout_value (Optional[int]): The value to reset the status fault to after the timeout.
+
+        Returns:
+            None
+        """
+        if self.__char_status_fault_timer is not None:
+            self.__char_status_fault_timer.cancel()
+            self.__char_status_fault_timer = None
+        if timeout != 0 and timeout_value is not None:
+            self.__char_status_fault_timer = self.driver.loop.call_later(timeout, self.__reset_status_fault, timeout_value)
 
     def __reset_status_fault(self, value: int) -> None:
         """
@@ -146,8 +258,9 @@ class GenericAccessory(Accessory):  # pylint: disable=too-many-instance-attribut
         Returns:
             None
         """
+        self.__char_status_fault_timer = None
         if self.char_status_fault is not None:
-            self.char_status_fault.set_value(value)
+            self._set_if_changed(self.char_status_fault, value)
 
 
 class BatteryGenericVehicleAccessory(GenericAccessory):
@@ -184,7 +297,7 @@ class BatteryGenericVehicleAccessory(GenericAccessory):
         if self.battery_service is None and isinstance(self.vehicle, ElectricVehicle):
             electric_drive: Optional[ElectricDrive] = self.vehicle.get_electric_drive()
             if electric_drive is not None and electric_drive.level is not None and electric_drive.level.enabled:
-                electric_drive.level.add_observer(self._on_level_change, Observable.ObserverEvent.VALUE_CHANGED)
+                self._add_cc_observer(electric_drive.level, self._on_level_change, flag=_VALUE_CHANGED)
                 self.battery_service: Optional[Service] = self.add_preload_service(service='BatteryService',  # pyright: ignore[reportArgumentType]
                                                                                    chars=['BatteryLevel',  # pyright: ignore[reportArgumentType]
                                                                                           'StatusLowBattery',
@@ -196,45 +309,28 @@ class BatteryGenericVehicleAccessory(GenericAccessory):
                 if self.service is not None:
                     self.service.add_linked_service(self.battery_service)
                 if self.vehicle.charging is not None and self.vehicle.charging.state is not None and self.vehicle.charging.state.enabled:
-                    self.vehicle.charging.state.add_observer(self._on_charging_state, Observable.ObserverEvent.VALUE_CHANGED)
+                    self._add_cc_observer(self.vehicle.charging.state, self._on_charging_state, flag=_VALUE_CHANGED)
                     self.char_charging_state = self.battery_service.configure_char('ChargingState')
                     self._set_charging_state(self.vehicle.charging.state.value)
 
     def _set_low_battery_status(self, level: Optional[float]) -> None:
         if self.char_status_low_battery is not None:
-            if level is None or level > 10:
-                self.char_status_low_battery.set_value(0)
-            else:
-                self.char_status_low_battery.set_value(1)
+            self._set_if_changed(self.char_status_low_battery, 1 if level is not None and level <= 10 else 0)
 
     def _set_charging_state(self, charging_state) -> None:
         if self.char_charging_state is not None:
-            if charging_state is not None:
-                if charging_state in (Charging.ChargingState.OFF,
-                                      Charging.ChargingState.READY_FOR_CHARGING,
-                                      Charging.ChargingState.UNSUPPORTED):
-                    self.char_charging_state.set_value(0)
-                elif charging_state in (Charging.ChargingState.CHARGING,
-                                        Charging.ChargingState.DISCHARGING,
-                                        Charging.ChargingState.CONSERVATION):
-                    self.char_charging_state.set_value(1)
-                elif charging_state == Charging.ChargingState.ERROR:
-                    self.char_charging_state.set_value(2)
-                else:
-                    self.char_charging_state.set_value(2)
-                    LOG.warning('unsupported charging state: %s', charging_state)
-            else:
-                self.char_charging_state.set_value(2)
+            self._set_mapped_value(self.char_charging_state, charging_state, _CHARGING_STATE_TO_BATTERY_CHARGING_STATE, default=2, logger=LOG,
+                                   description='charging state')
 
     def _on_level_change(self, element: Any, flags: Observable.ObserverEvent) -> None:
         with self.cc_level_lock:
-            if flags & Observable.ObserverEvent.VALUE_CHANGED:
+            if flags & _VALUE_CHANGED:
                 if element.value is not None and self.char_battery_level is not None:
-                    self.char_battery_level.set_value(element.value)
+                    self._set_if_changed(self.char_battery_level, element.value)
                     self._set_low_battery_status(element.value)
 
     def _on_charging_state(self, element: Any, flags: Observable.ObserverEvent) -> None:
         with self.cc_charging_state_lock:
-            if flags & Observable.ObserverEvent.VALUE_CHANGED:
+            if flags & _VALUE_CHANGED:
                 if element.value is not None and self.char_charging_state is not None:
                     self._set_charging_state(element.value)
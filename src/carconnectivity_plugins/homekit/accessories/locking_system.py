@@ -18,7 +18,7 @@ from carconnectivity.doors import Doors
 from carconnectivity_plugins.homekit.accessories.generic_accessory import GenericAccessory
 
 if TYPE_CHECKING:
-    from typing import Optional, Any, Dict
+    from typing import Optional, Any, Dict, Tuple
 
     from pyhap.service import Service
     from pyhap.accessory_driver import AccessoryDriver
@@ -30,6 +30,16 @@ if TYPE_CHECKING:
 
 LOG: logging.Logger = logging.getLogger("carconnectivity.plugins.homekit.locking")
 
+_VALUE_CHANGED: Observable.ObserverEvent = Observable.ObserverEvent.VALUE_CHANGED
+
+# Values of the LockCurrentState and LockTargetState characteristics for the supported lock states
+_LOCK_STATE_TO_CURRENT_TARGET_STATES: Dict[Doors.LockState, Tuple[int, int]] = {
+    Doors.LockState.LOCKED: (1, 1),
+    Doors.LockState.UNLOCKED: (0, 0),
+    Doors.LockState.INVALID: (3, 1),
+    Doors.LockState.UNKNOWN: (3, 1),
+}
+
 
 class LockingAccessory(GenericAccessory):
     """Flashing Light Accessory"""
@@ -61,26 +71,23 @@ class LockingAccessory(GenericAccessory):
                 self.char_lock_target_state = self.service.configure_char('LockTargetState', setter_callback=self.__on_hk_lock_target_state_change)
                 self.char_lock_target_state.allow_invalid_client_values = True
             if self.vehicle.doors.lock_state is not None:
-                self.vehicle.doors.lock_state.add_observer(self.__on_cc_lock_state_change, flag=Observable.ObserverEvent.VALUE_CHANGED)
+                self._add_cc_observer(self.vehicle.doors.lock_state, self.__on_cc_lock_state_change, flag=_VALUE_CHANGED)
                 self.char_lock_current_state = self.service.configure_char('LockCurrentState')
                 if self.vehicle.doors.lock_state.enabled:
-                    self.__on_cc_lock_state_change(self.vehicle.doors.lock_state, flags=Observable.ObserverEvent.VALUE_CHANGED)
+                    self.__on_cc_lock_state_change(self.vehicle.doors.lock_state, flags=_VALUE_CHANGED)
                 else:
-                    self.__on_cc_lock_state_change(Doors.LockState.UNKNOWN, flags=Observable.ObserverEvent.VALUE_CHANGED)
+                    self.__on_cc_lock_state_change(Doors.LockState.UNKNOWN, flags=_VALUE_CHANGED)
 
     def __on_hk_lock_target_state_change(self, value: Any) -> None:
         if self.char_lock_target_state is not None:
             if self.lock_unlock_command is not None and self.lock_unlock_command.enabled:
-                command_args: Dict[str, Any] = {}
                 try:
                     if value == 1:
                         LOG.info('Lock car')
-                        command_args['command'] = LockUnlockCommand.Command.LOCK
-                        self.lock_unlock_command.value = command_args
+                        self.lock_unlock_command.value = {'command': LockUnlockCommand.Command.LOCK}
                     elif value == 0:
                         LOG.info('Unlock car')
-                        command_args['command'] = LockUnlockCommand.Command.UNLOCK
-                        self.lock_unlock_command.value = command_args
+                        self.lock_unlock_command.value = {'command': LockUnlockCommand.Command.UNLOCK}
                     else:
                         LOG.error('Input for lock target not understood: %d', value)
                         self.set_status_fault(1, timeout=120)
@@ -101,26 +108,13 @@ class LockingAccessory(GenericAccessory):
 
     def __on_cc_lock_state_change(self, element: Any, flags: Observable.ObserverEvent) -> None:
         with self.cc_lock_state_lock:
-            if flags & Observable.ObserverEvent.VALUE_CHANGED:
+            if flags & _VALUE_CHANGED:
                 if self.char_lock_current_state is not None:
-                    if element.value == Doors.LockState.LOCKED:
-                        self.char_lock_current_state.set_value(1)
-                        if self.char_lock_target_state is not None:
-                            self.char_lock_target_state.set_value(1)
-                    elif element.value == Doors.LockState.UNLOCKED:
-                        self.char_lock_current_state.set_value(0)
-                        if self.char_lock_target_state is not None:
-                            self.char_lock_target_state.set_value(0)
-                    elif element.value == Doors.LockState.INVALID:
-                        self.char_lock_current_state.set_value(3)
-                        if self.char_lock_target_state is not None:
-                            self.char_lock_target_state.set_value(1)
-                    elif element.value == Doors.LockState.UNKNOWN:
-                        self.char_lock_current_state.set_value(3)
-                        if self.char_lock_target_state is not None:
-                            self.char_lock_target_state.set_value(1)
-                    else:
-                        self.char_lock_current_state.set_value(3)
-                        if self.char_lock_target_state is not None:
-                            self.char_lock_target_state.set_value(1)
+                    states: Optional[Tuple[int, int]] = _LOCK_STATE_TO_CURRENT_TARGET_STATES.get(element.value)
+                    if states is None:
+                        states = (3, 1)
                         LOG.warning('unsupported lock state: %s', element.value)
+                    current_state, target_state = states
+                    self._set_if_changed(self.char_lock_current_state, current_state)
+                    if self.char_lock_target_state is not None:
+                        self._set_if_changed(self.char_lock_target_state, target_state)
@@ -67,29 +67,29 @@ class OutsideTemperatureAccessory(GenericAccessory):
 
         if self.vehicle is not None and vehicle.outside_temperature is not None:
             self.outside_temperature_attribute = self.vehicle.outside_temperature
-            self.vehicle.outside_temperature.add_observer(self.__on_cc_outside_temperature_change, flag=Observable.ObserverEvent.VALUE_CHANGED)
+            self._add_cc_observer(self.vehicle.outside_temperature, self.__on_cc_outside_temperature_change, flag=Observable.ObserverEvent.VALUE_CHANGED)
             self.char_current_temperature = self.service.configure_char('CurrentTemperature')
             if vehicle.outside_temperature.enabled:
                 self.__on_cc_outside_temperature_change(self.vehicle.outside_temperature, Observable.ObserverEvent.VALUE_CHANGED)
     # pylint: disable=duplicate-code
 
     def __on_cc_outside_temperature_change(self, element: Any, flags: Observable.ObserverEvent) -> None:
+        if not flags & Observable.ObserverEvent.VALUE_CHANGED or not isinstance(element, TemperatureAttribute):
+            LOG.debug('Unsupported event %s', flags)
+            return
         with self.cc_temperature_lock:
-            if flags & Observable.ObserverEvent.VALUE_CHANGED and isinstance(element, TemperatureAttribute):
-                target_temperature_unit: Temperature = Temperature.C
-                if self.char_temperature_display_units is not None:
-                    target_temperature_unit = VALUE_TO_TEMPERATURE_UNIT[self.char_temperature_display_units.get_value()]
-                if self.char_current_temperature is not None and element.enabled and element.value is not None:
-                    self.char_current_temperature.set_value(element.temperature_in(unit=target_temperature_unit))
-                LOG.info('targetTemperature Changed: %f', element.temperature_in(unit=target_temperature_unit))
-            else:
-                LOG.debug('Unsupported event %s', flags)
+            # configured_temperature_unit follows the TemperatureDisplayUnits characteristic
+            temperature: Optional[float] = element.temperature_in(unit=self.configured_temperature_unit)
+            if self.char_current_temperature is not None and element.enabled and element.value is not None:
+                self._set_if_changed(self.char_current_temperature, temperature)
+            LOG.info('targetTemperature Changed: %s', temperature)
 
     def __on_hk_temperature_display_units_change(self, value: int) -> None:
         if value in VALUE_TO_TEMPERATURE_UNIT:
             if self.char_temperature_display_units is not None:
                 self.char_temperature_display_units.set_value(value)
-            self.bridge.set_config_item(self.id_str, self.vin, 'TemperatureDisplayUnits', value)
+            if self.bridge.set_config_item(self.id_str, self.vin, 'TemperatureDisplayUnits', value):
+                self.bridge.persist_config()
             self.configured_temperature_unit = VALUE_TO_TEMPERATURE_UNIT[value]
             if self.outside_temperature_attribute is not None:
                 self.__on_cc_outside_temperature_change(element=self.outside_temperature_attribute, flags=Observable.ObserverEvent.VALUE_CHANGED)
@@ -2,8 +2,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 
-import threading
-
 import logging
 
 
@@ -31,6 +29,15 @@ if TYPE_CHECKING:
 
 LOG: logging.Logger = logging.getLogger("carconnectivity.plugins.homekit.window_heating")
 
+# Value of the On characteristic for the supported window heating states
+_HEATING_STATE_TO_ON: Dict[WindowHeatings.HeatingState, int] = {
+    WindowHeatings.HeatingState.OFF: 0,
+    WindowHeatings.HeatingState.ON: 1,
+    WindowHeatings.HeatingState.INVALID: 0,
+    WindowHeatings.HeatingState.UNSUPPORTED: 0,
+    WindowHeatings.HeatingState.UNKNOWN: 0,
+}
+
 
 class WindowHeatingAccessory(GenericAccessory):  # pylint: disable=too-many-instance-attributes
     """Window heating Accessory"""
@@ -52,14 +59,13 @@ class WindowHeatingAccessory(GenericAccessory):  # pylint: disable=too-many-inst
 
         self.window_heating_start_stop_command: Optional[GenericCommand] = None
 
-        self.cc_heating_state_lock: threading.Lock = threading.Lock()
-
         self.add_name_characteristics()
         self.add_status_fault_characteristic()
 
         if self.vehicle is not None and self.vehicle.window_heatings is not None:
             if self.vehicle.window_heatings.heating_state is not None:
-                self.vehicle.window_heatings.heating_state.add_observer(self.__on_cc_heating_state_change, flag=Observable.ObserverEvent.VALUE_CHANGED)
+                self._add_cc_observer(self.vehicle.window_heatings.heating_state, self.__on_cc_heating_state_change,
+                                      flag=Observable.ObserverEvent.VALUE_CHANGED)
                 self.char_on = self.service.configure_char('On', setter_callback=self.__on_hk_on_change)
                 if self.vehicle.window_heatings.heating_state.enabled:
                     self.__on_cc_heating_state_change(self.vehicle.window_heatings.heating_state, Observable.ObserverEvent.VALUE_CHANGED)
@@ -69,38 +75,21 @@ class WindowHeatingAccessory(GenericAccessory):  # pylint: disable=too-many-inst
                     self.window_heating_start_stop_command = self.vehicle.window_heatings.commands.commands['start-stop']
 
     def __on_cc_heating_state_change(self, element: Any, flags: Observable.ObserverEvent) -> None:
-        with self.cc_heating_state_lock:
-            if flags & Observable.ObserverEvent.VALUE_CHANGED:
-                if self.char_on is not None:
-                    if element.value is None:
-                        self.char_on.set_value(0)
-                    elif element.value == WindowHeatings.HeatingState.OFF:
-                        self.char_on.set_value(0)
-                    elif element.value == WindowHeatings.HeatingState.ON:
-                        self.char_on.set_value(1)
-                    elif element.value in (WindowHeatings.HeatingState.INVALID,
-                                           WindowHeatings.HeatingState.UNSUPPORTED,
-                                           WindowHeatings.HeatingState.UNKNOWN):
-                        self.char_on.set_value(0)
-                    else:
-                        self.char_on.set_value(0)
-                        LOG.warning('unsupported Window Heating state: %s', element.value.value)
-            else:
-                LOG.debug('Unsupported event %s', flags)
+        if not flags & Observable.ObserverEvent.VALUE_CHANGED:
+            LOG.debug('Unsupported event %s', flags)
+            return
+        if self.char_on is not None:
+            self._set_mapped_value(self.char_on, element.value, _HEATING_STATE_TO_ON, default=0, logger=LOG, description='Window Heating state')
 
     def __on_hk_on_change(self, value: Any) -> None:
         try:
             if self.window_heating_start_stop_command is not None and self.window_heating_start_stop_command.enabled:
-                if value in [1, 2, 3]:
+                if value in (1, 2, 3):
                     LOG.info('Switch window heating ging on')
-                    command_args: Dict[str, Any] = {}
-                    command_args['command'] = WindowHeatingStartStopCommand.Command.START
-                    self.window_heating_start_stop_command.value = command_args
+                    self.window_heating_start_stop_command.value = {'command': WindowHeatingStartStopCommand.Command.START}
                 elif value == 0:
                     LOG.info('Switch window heating off')
-                    command_args: Dict[str, Any] = {}
-                    command_args['command'] = WindowHeatingStartStopCommand.Command.STOP
-                    self.window_heating_start_stop_command.value = command_args
+                    self.window_heating_start_stop_command.value = {'command': WindowHeatingStartStopCommand.Command.STOP}
                 else:
                     LOG.error('Input for window heating not understood: %d', value)
         except SetterError as setter_error:
@@ -19,11 +19,22 @@ from carconnectivity_plugins.homekit.accessories.custom_characteristics import C
 from carconnectivity_plugins.homekit.accessories.bridge import CarConnectivityBridge
 
 if TYPE_CHECKING:
-    from typing import Dict, Optional
+    from typing import Dict, Optional, Any, Tuple
     from carconnectivity.carconnectivity import CarConnectivity
+    from carconnectivity.garage import Garage
 
 LOG: logging.Logger = logging.getLogger("carconnectivity.plugins.homekit")
 
+_PINCODE_RE: re.Pattern[str] = re.compile(r'^\d{3}-\d{2}-\d{3}\Z')
+
+# Options that fall back to a default if they are missing or None in the configuration
+_CONFIG_DEFAULTS: Tuple[Tuple[str, Any], ...] = (
+    ('address', None),
+    ('port', 51234),
+    ('accessory_state_file', '~/.carconnectivity/homekit-accessory.state'),
+    ('accessory_config_file', '~/.carconnectivity/homekit-accessory.config'),
+)
+
 
 class Plugin(BasePlugin):
     """
@@ -38,53 +49,34 @@ class Plugin(BasePlugin):
                             **kwargs)
 
         self._background_thread: Optional[threading.Thread] = None
+        self._update_thread: Optional[threading.Thread] = None
         self.stop_event = threading.Event()
 
         LOG.info("Loading homekit plugin with config %s", config_remove_credentials(config))
 
-        if 'address' in config and config['address'] is not None:
-            self.active_config['address'] = config['address']
-        else:
-            self.active_config['address'] = None
+        for config_key, default in _CONFIG_DEFAULTS:
+            value: Any = config.get(config_key)
+            self.active_config[config_key] = default if value is None else value
+        for config_key in ('ignore_vins', 'ignore_accessory_types'):
+            self.active_config[config_key] = config.get(config_key) or []
 
-        if 'port' in config and config['port'] is not None:
-            self.active_config['port'] = config['port']
-            if self.active_config['port'] > 65535 or self.active_config['port'] < 1:
-                raise ConfigurationError(f'Invalid port: "{self.active_config["port"]}" not in range 1-65535')
-        else:
-            self.active_config['port'] = 51234
+        if self.active_config['port'] > 65535 or self.active_config['port'] < 1:
+            raise ConfigurationError(f'Invalid port: "{self.active_config["port"]}" not in range 1-65535')
 
         if 'pincode' in config and config['pincode'] is not None:
             pincode_str: str = config['pincode']
-            if not re.match(pattern=r'^\d{3}-\d{2}-\d{3}$', string=pincode_str):
+            if not _PINCODE_RE.match(pincode_str):
                 raise ConfigurationError(f'Invalid pincode format: "{pincode_str}". Expected format is "xxx-xx-xxx" where x is a digit.')
             pincode: Optional[bytes] = pincode_str.encode('utf-8')
         else:
             pincode = None
 
-        if 'accessory_state_file' in config and config['accessory_state_file'] is not None:
-            self.active_config['accessory_state_file'] = os.path.expanduser(config['accessory_state_file'])
-        else:
-            self.active_config['accessory_state_file'] = os.path.expanduser('~/.carconnectivity/homekit-accessory.state')
-        file = Path(self.active_config['accessory_state_file'])
-        file.parent.mkdir(parents=True, exist_ok=True)
-
-        if 'accessory_config_file' in config and config['accessory_config_file'] is not None:
-            self.active_config['accessory_config_file'] = os.path.expanduser(config['accessory_config_file'])
-        else:
-            self.active_config['accessory_config_file'] = os.path.expanduser('~/.carconnectivity/homekit-accessory.config')
-        file = Path(self.active_config['accessory_config_file'])
-        file.parent.mkdir(parents=True, exist_ok=True)
+        self.active_config['accessory_state_file'] = os.path.expanduser(self.active_config['accessory_state_file'])
+        self.active_config['accessory_config_file'] = os.path.expanduser(self.active_config['accessory_config_file'])
 
-        if 'ignore_vins' in config and config['ignore_vins'] is not None:
-            self.active_config['ignore_vins'] = config['ignore_vins']
-        else:
-            self.active_config['ignore_vins'] = []
-
-        if 'ignore_accessory_types' in config and config['ignore_accessory_types'] is not None:
-            self.active_config['ignore_accessory_types'] = config['ignore_accessory_types']
-        else:
-            self.active_config['ignore_accessory_types'] = []
+        # Both files usually live in the same directory, so it only needs to be created once
+        for directory in {Path(self.active_config['accessory_state_file']).parent, Path(self.active_config['accessory_config_file']).parent}:
+            directory.mkdir(parents=True, exist_ok=True)
 
         # Add the accessory driver
         self._driver = AccessoryDriver(address=self.active_config['address'], port=self.active_config['port'], pincode=pincode,
@@ -103,9 +95,9 @@ class Plugin(BasePlugin):
         self._background_thread = threading.Thread(target=self._driver.start, daemon=False)
         self._background_thread.name = 'carconnectivity.plugins.homekit-background'
         self._background_thread.start()
-        update_thread = threading.Timer(interval=5.0, function=self.__delayed_update)
-        update_thread.daemon = True
-        update_thread.start()
+        self._update_thread = threading.Thread(target=self.__delayed_update, daemon=True)
+        self._update_thread.name = 'carconnectivity.plugins.homekit-update'
+        self._update_thread.start()
         self.healthy._set_value(value=True)  # pylint: disable=protected-access
         LOG.debug("Starting Homekit plugin done")
 
@@ -113,15 +105,22 @@ class Plugin(BasePlugin):
         self.stop_event.wait(5.0)
         if not self.stop_event.is_set():
             self._bridge.install_observers()
-            if self.car_connectivity.garage is not None:
-                for vehicle in self.car_connectivity.garage.list_vehicles():
-                    self._bridge.update(vehicle=vehicle)
+            garage: Optional[Garage] = self.car_connectivity.garage
+            if garage is not None:
+                with self._bridge.batch_update():
+                    for vehicle in garage.list_vehicles():
+                        self._bridge.update(vehicle=vehicle)
 
     def shutdown(self) -> None:
         self.stop_event.set()
+        # A running update may still change the accessory config, so wait for it before stopping the driver
+        if self._update_thread is not None:
+            self._update_thread.join()
         self._driver.stop()
         if self._background_thread is not None:
             self._background_thread.join()
+        # Only flush when nothing can change the accessory config anymore
+        self._bridge.flush_config()
         return super().shutdown()
 
     def get_version(self) -> str:
@@ -5,8 +5,10 @@ from typing import TYPE_CHECKING
 
 import os
 import asyncio
+import hashlib
 from io import BytesIO
 from uuid import UUID
+from functools import lru_cache
 from pyqrcode import pyqrcode
 
 import flask
@@ -20,9 +22,22 @@ from carconnectivity_plugins.base.ui.plugin_ui import BasePluginUI
 from carconnectivity_plugins.homekit.plugin import Plugin
 
 if TYPE_CHECKING:
-    from typing import Optional, List, Dict, Union, Literal
+    from typing import Optional, List, Dict, Tuple, Union, Literal
 
-    from carconnectivity.carconnectivity import CarConnectivity
+
+@lru_cache(maxsize=4)
+def _qr_png(xhm_uri: str) -> Tuple[bytes, str]:
+    """
+    Renders the pairing QR code for `xhm_uri` as PNG. The URI only changes with the pairing setup, so the image is cached.
+
+    Returns:
+        Tuple[bytes, str]: The PNG image and an ETag for it.
+    """
+    qrcode = pyqrcode.create(xhm_uri)
+    img_io = BytesIO()
+    qrcode.png(img_io, scale=12)
+    png: bytes = img_io.getvalue()
+    return png, hashlib.sha1(png, usedforsecurity=False).hexdigest()
 
 
 class PluginUI(BasePluginUI):
@@ -33,6 +48,9 @@ class PluginUI(BasePluginUI):
         blueprint: Optional[flask.Blueprint] = flask.Blueprint(name=plugin.id, import_name='carconnectivity-plugin-homekit', url_prefix=f'/{plugin.id}',
                                                                template_folder=os.path.dirname(__file__) + '/templates')
         super().__init__(plugin, blueprint=blueprint, app=app, *args, **kwargs)
+        self._nav_urls: Optional[Tuple[str, str]] = None
+        # The plugin does not change for the lifetime of the UI, so its type is only checked once
+        homekit_plugin: Optional[Plugin] = plugin if isinstance(plugin, Plugin) else None
 
         class HomekitForm(FlaskForm):
             """
@@ -50,22 +68,23 @@ class PluginUI(BasePluginUI):
         @self.blueprint.route('/pairing', methods=['GET', 'POST'])
         @login_required
         def pairing():
-            if isinstance(self.plugin, Plugin):
-                plugin: Plugin = self.plugin
+            if homekit_plugin is not None:
+                plugin: Plugin = homekit_plugin
 
                 form = HomekitForm()
 
                 if form.unpair.data:
-                    clients: list[UUID] = list(plugin._driver.state.paired_clients.keys()).copy()  # pylint: disable=protected-access
-                    for client in clients:
+                    clients: list[UUID] = list(plugin._driver.state.paired_clients.keys())  # pylint: disable=protected-access
+                    if clients:
+                        # unpair needs an event loop in the current thread, flask request threads have none by default
                         try:
                             asyncio.get_event_loop()
-                        except RuntimeError as ex:
-                            if "There is no current event loop in thread" in str(ex):
-                                loop: AbstractEventLoop = asyncio.new_event_loop()
-                                asyncio.set_event_loop(loop)
-                        plugin._driver.unpair(client)  # pylint: disable=protected-access
-                    plugin._driver.config_changed()  # pylint: disable=protected-access
+                        except RuntimeError:
+                            loop: AbstractEventLoop = asyncio.new_event_loop()
+                            asyncio.set_event_loop(loop)
+                        for client in clients:
+                            plugin._driver.unpair(client)  # pylint: disable=protected-access
+                        plugin._driver.config_changed()  # pylint: disable=protected-access
                     flask.flash('Unpaired the Homekit bridge. You can now pair again')
 
                 return flask.render_template('homekit/pairing.html', form=form, current_app=flask.current_app, homekit_plugin=plugin)
@@ -79,28 +98,25 @@ class PluginUI(BasePluginUI):
         @self.blueprint.route('/homekit-qr.png', methods=['GET'])
         @login_required
         def homekit_qr():
-            if 'car_connectivity' not in flask.current_app.extensions:
-                flask.abort(500, "Status picture doesn't exist.")
-            car_connectivity: Optional[CarConnectivity] = flask.current_app.extensions['car_connectivity']
-            if car_connectivity is not None:
-                if 'homekit' in car_connectivity.plugins.plugins and car_connectivity.plugins.plugins['homekit'] is not None \
-                        and isinstance(car_connectivity.plugins.plugins['homekit'], Plugin):
-                    plugin: Plugin = car_connectivity.plugins.plugins['homekit']
-                    if (accessory := plugin._driver.accessory) is not None:  # pylint: disable=protected-access
-                        xhm_uri = accessory.xhm_uri()
-                        qrcode = pyqrcode.create(xhm_uri)
-                        img_io = BytesIO()
-                        qrcode.png(img_io, scale=12)
-                        img_io.seek(0)
-                        return flask.send_file(img_io, mimetype='image/png')
+            if homekit_plugin is not None:
+                if (accessory := homekit_plugin._driver.accessory) is not None:  # pylint: disable=protected-access
+                    png, etag = _qr_png(accessory.xhm_uri())
+                    # private, as the QR code contains the pincode and the route requires a login
+                    response: flask.Response = flask.send_file(BytesIO(png), mimetype='image/png', conditional=True, etag=etag, max_age=300)
+                    response.cache_control.public = False
+                    response.cache_control.private = True
+                    return response
             return flask.abort(500, "HomeKit plugin not found or wrong structure.")
 
     def get_nav_items(self) -> List[Dict[Literal['text', 'url', 'sublinks', 'divider'], Union[str, List]]]:
         """
         Generates a list of navigation items for the HomeKit plugin UI.
         """
-        return super().get_nav_items() + [{"text": "Pairing", "url": flask.url_for('plugins.homekit.pairing')},
-                                          {"text": "Accessories", "url": flask.url_for('plugins.homekit.accessories')},]
+        # The URLs do not change while the app runs, so they are only built on the first request
+        if self._nav_urls is None:
+            self._nav_urls = (flask.url_for('plugins.homekit.pairing'), flask.url_for('plugins.homekit.accessories'))
+        return super().get_nav_items() + [{"text": "Pairing", "url": self._nav_urls[0]},
+                                          {"text": "Accessories", "url": self._nav_urls[1]},]
 
     def get_title(self) -> str:
         """